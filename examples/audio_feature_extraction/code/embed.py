@@ -0,0 +1,171 @@
+import asyncio
+from pathlib import Path
+from typing import Annotated
+
+import orjson
+import typer
+
+from tigerflow.tasks import LocalAsyncTask
+from tigerflow.utils import SetupContext
+
+# Below this size, blocking file I/O is cheaper than a thread-pool round trip
+SMALL_FILE_BYTES = 64 * 1024
+
+
+class EmbeddingBatcher:
+    """
+    Group texts from concurrent `run` calls into batched API requests.
+
+    A batch is sent once it reaches `batch_size` texts or `max_wait`
+    seconds after its first text arrives, whichever comes first. Note
+    that batches cannot grow beyond the task's concurrency limit.
+    """
+
+    def __init__(self, *, session, url, headers, model, batch_size, max_wait, rate):
+        self.session = session
+        self.url = url
+        self.headers = headers
+        self.model = model
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        # Each request holds a slot for one second, capping the request rate
+        # across all coroutines without serializing them
+        self.rate_limiter = asyncio.Semaphore(rate)
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._requests: set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            request = asyncio.create_task(self._send(batch))
+            self._requests.add(request)  # Keep a reference until done
+            request.add_done_callback(self._requests.discard)
+
+    async def _send(self, batch: list[tuple[str, asyncio.Future]]):
+        try:
+            await self.rate_limiter.acquire()
+            asyncio.get_running_loop().call_later(1, self.rate_limiter.release)
+
+            payload = {
+                "input": [text for text, _ in batch],
+                "model": self.model,
+                "input_type": "document",
+            }
+            async with self.session.post(
+                self.url,
+                headers=self.headers,  # Already declares the JSON content type
+                data=orjson.dumps(payload),
+            ) as resp:
+                resp.raise_for_status()  # Raise error if unsuccessful
+                result = orjson.loads(await resp.read())
+
+            # Results carry the index of their input text
+            for item in result["data"]:
+                future = batch[item["index"]][1]
+                if not future.done():
+                    future.set_result(item["embedding"])
+            # Fail any text the response left out, or its caller waits forever
+            if not all(future.done() for _, future in batch):
+                raise RuntimeError("Response is missing embeddings for some inputs")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+class Embed(LocalAsyncTask):
+    class Params:
+        model: Annotated[
+            str,
+            typer.Option(help="Embedding model name"),
+        ] = "voyage-3.5"
+        rate_limit: Annotated[
+            int,
+            typer.Option(help="Maximum number of API requests per second"),
+        ] = 10
+        batch_size: Annotated[
+            int,
+            typer.Option(help="Maximum number of texts embedded per API request"),
+        ] = 8
+        batch_wait: Annotated[
+            float,
+            typer.Option(help="Seconds to wait for a batch to fill before sending"),
+        ] = 0.5
+
+    @staticmethod
+    async def setup(context: SetupContext):
+        import os
+
+        import aiohttp
+
+        # Keep connections alive across requests to skip repeated TLS handshakes
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+        )
+        context.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=60),
+        )
+        context.batcher = EmbeddingBatcher(
+            session=context.session,
+            url="https://api.voyageai.com/v1/embeddings",
+            headers={
+                "Authorization": f"Bearer {os.environ['VOYAGE_API_KEY']}",
+                "Content-Type": "application/json",
+            },
+            model=context.model,
+            batch_size=context.batch_size,
+            max_wait=context.batch_wait,
+            rate=context.rate_limit,
+        )
+        print("Session created successfully!")
+
+    @staticmethod
+    async def run(context: SetupContext, input_file: Path, output_file: Path):
+        import aiofiles
+
+        if input_file.stat().st_size < SMALL_FILE_BYTES:
+            text = input_file.read_text()
+        else:
+            async with aiofiles.open(input_file) as f:
+                text = await f.read()
+
+        embedding = await context.batcher.embed(text.strip())
+
+        # Keep the single-input response layout expected downstream
+        result = {
+            "data": [{"embedding": embedding, "index": 0}],
+            "model": context.model,
+        }
+
+        content = orjson.dumps(result)
+        if len(content) < SMALL_FILE_BYTES:
+            output_file.write_bytes(content)
+        else:
+            async with aiofiles.open(output_file, "wb") as f:
+                await f.write(content)
+
+    @staticmethod
+    async def teardown(context: SetupContext):
+        await context.session.close()
+        print("Session closed successfully!")
+
+
+Embed.cli()
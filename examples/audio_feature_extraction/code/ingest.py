@@ -0,0 +1,140 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Annotated
+
+import numpy as np
+import orjson
+import pyarrow as pa
+import typer
+
+from tigerflow.tasks import LocalTask
+from tigerflow.utils import SetupContext
+
+DB_PATH = Path(__file__).parent.parent / "results" / "test.db"
+EMBEDDING_DIM = 1024
+
+
+class Ingest(LocalTask):
+    class Params:
+        db_path: Annotated[
+            Path,
+            typer.Option(help="Path to the DuckDB database file"),
+        ] = DB_PATH
+        batch_size: Annotated[
+            int,
+            typer.Option(help="Number of embeddings to buffer per bulk insert"),
+        ] = 1000
+        threads: Annotated[
+            int,
+            typer.Option(help="Number of DuckDB worker threads"),
+        ] = 8
+        memory_limit: Annotated[
+            str,
+            typer.Option(help="DuckDB memory limit (e.g., 4GB)"),
+        ] = "4GB"
+
+    @staticmethod
+    def setup(context: SetupContext):
+        import duckdb
+
+        conn = duckdb.connect(str(context.db_path))  # Creates file if not existing
+        print(f"Successfully connected to {context.db_path}")
+
+        # Tune for bulk appends; row order across batches carries no meaning
+        conn.execute(f"SET threads = {context.threads}")
+        conn.execute("SET memory_limit = ?", [context.memory_limit])
+        conn.execute("SET preserve_insertion_order = false")
+
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                id UBIGINT,
+                embedding FLOAT[{EMBEDDING_DIM}],
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+
+        context.conn = conn
+        context.buffer = []  # Rows awaiting a bulk insert
+        # A single writer thread inserts one batch while the next is parsed
+        context.writer = ThreadPoolExecutor(max_workers=1)
+        context.inserts = []  # Bulk insert in flight, if any
+
+    @staticmethod
+    def insert(conn, rows: list[tuple[int, np.ndarray]]):
+        # Hand the whole batch to DuckDB as an Arrow table, which it scans
+        # without converting row by row
+        ids = pa.array([file_id for file_id, _ in rows], pa.uint64())
+        vectors = np.stack([embedding for _, embedding in rows])
+        embeddings = pa.FixedSizeListArray.from_arrays(
+            pa.array(vectors.ravel()), vectors.shape[1]
+        )
+        batch = pa.table([ids, embeddings], names=["id", "embedding"])
+
+        conn.register("batch", batch)
+        try:
+            conn.execute(
+                "INSERT INTO embeddings (id, embedding) SELECT id, embedding FROM batch"
+            )
+        except Exception as e:
+            # The error surfaces on a later file, so name the files it lost
+            file_ids = ", ".join(str(file_id) for file_id, _ in rows)
+            raise RuntimeError(f"Failed to insert embeddings for {file_ids}") from e
+        finally:
+            conn.unregister("batch")
+        print(f"Inserted {len(rows)} embeddings")
+
+    @staticmethod
+    def flush(context: SetupContext):
+        # Wait for the previous batch so that at most one insert is in flight
+        # and its errors surface here, once: a failed insert must not be
+        # raised again by every later flush
+        inserts, context.inserts = context.inserts, []
+        for future in inserts:
+            future.result()
+
+        if not context.buffer:
+            return
+        rows = list(context.buffer)
+        context.buffer.clear()
+        context.inserts.append(context.writer.submit(Ingest.insert, context.conn, rows))
+
+    @staticmethod
+    def run(context: SetupContext, input_file: Path, output_file: Path):
+        with open(input_file, "rb") as f:
+            content = orjson.loads(f.read())
+
+        # Keep vectors as float32 arrays so a batch stacks into one buffer
+        embedding = np.asarray(content["data"][0]["embedding"], dtype=np.float32)
+        # Fail the offending file here rather than the batch it would join
+        file_id = int(input_file.stem)
+        if file_id < 0:
+            raise ValueError(f"Expected a non-negative file ID, got {file_id}")
+        if embedding.shape != (EMBEDDING_DIM,):
+            raise ValueError(
+                f"Expected an embedding of shape ({EMBEDDING_DIM},), "
+                f"got {embedding.shape}"
+            )
+
+        # Buffer rows and insert them in bulk to amortize per-statement overhead.
+        # Note that this makes ingestion at-most-once: a file counts as done
+        # when run() returns, so if the task crashes before the next flush, up
+        # to batch_size buffered rows are lost and their files are not retried.
+        # Likewise, a failed insert is raised by whichever later file triggers
+        # the next flush, and that file's error names the files actually lost.
+        # Use --batch-size 1 where every row must be written.
+        context.buffer.append((file_id, embedding))
+        if len(context.buffer) >= context.batch_size:
+            Ingest.flush(context)
+
+    @staticmethod
+    def teardown(context: SetupContext):
+        try:
+            Ingest.flush(context)  # Insert any remaining rows
+            Ingest.flush(context)  # Wait for that insert to finish
+        finally:
+            context.writer.shutdown()
+            context.conn.close()
+            print("DB connection closed")
+
+
+Ingest.cli()
@@ -0,0 +1,59 @@
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from tigerflow.tasks import SlurmTask
+from tigerflow.utils import SetupContext
+
+MODEL_DIR = Path(__file__).parent.parent / "models" / "whisper" / "medium"
+
+
+class Transcribe(SlurmTask):
+    class Params:
+        model_dir: Annotated[
+            Path,
+            typer.Option(help="Path to the CTranslate2-converted Whisper model"),
+        ] = MODEL_DIR
+        compute_type: Annotated[
+            str,
+            typer.Option(
+                help="Weight/activation precision (e.g., int8, int8_float16, float16)"
+            ),
+        ] = "int8_float16"
+        batch_size: Annotated[
+            int,
+            typer.Option(help="Number of 30-second audio chunks decoded together"),
+        ] = 8
+
+    @staticmethod
+    def setup(context: SetupContext):
+        from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+        # Unsupported compute types fall back to the closest one on the device
+        model = WhisperModel(
+            str(context.model_dir),
+            device="auto",
+            compute_type=context.compute_type,
+        )
+        # Split each file into voiced chunks and decode them as a batch
+        context.model = BatchedInferencePipeline(model=model)
+        print("Model loaded successfully")
+
+    @staticmethod
+    def run(context: SetupContext, input_file: Path, output_file: Path):
+        segments, _ = context.model.transcribe(
+            str(input_file),
+            batch_size=context.batch_size,
+            beam_size=1,
+            vad_filter=True,
+            without_timestamps=True,  # Only the text is kept
+        )
+        text = "".join(segment.text for segment in segments)  # Runs inference
+        print(f"Transcription ran successfully for {input_file}")
+
+        with open(output_file, "w") as f:
+            f.write(text)
+
+
+Transcribe.cli()
@@ -0,0 +1,10 @@
+from pathlib import Path
+
+from faster_whisper import download_model
+
+MODEL_DIR = Path(__file__).parent / "medium"
+
+if MODEL_DIR.exists():
+    print("Model already downloaded at:", MODEL_DIR)
+else:
+    download_model("medium", output_dir=str(MODEL_DIR))
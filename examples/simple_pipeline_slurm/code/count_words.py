@@ -0,0 +1,44 @@
+import time
+from collections import Counter
+from typing import Annotated
+
+import orjson
+import typer
+
+from tigerflow.tasks import SlurmTask
+
+# Byte translation table that lowercases ASCII letters and maps every
+# other byte to a space, so words can be split off without a regex
+WORD_TABLE = bytes(
+    c | 0x20 if chr(c).isascii() and chr(c).isalpha() else ord(" ") for c in range(256)
+)
+
+
+class CountUniqueWords(SlurmTask):
+    class Params:
+        simulate_work: Annotated[
+            bool,
+            typer.Option(
+                "--simulate-work",
+                help="Sleep for a few seconds per file to simulate heavy computation",
+            ),
+        ] = False
+
+    @staticmethod
+    def run(context, input_file, output_file):
+        with open(input_file, "rb") as f:
+            content = f.read()
+
+        # Extract and count words made of letters
+        words = content.translate(WORD_TABLE).split()
+        word_counts = Counter(words)
+        if context.simulate_work:
+            time.sleep(3)
+
+        # Keys are ASCII-only by construction, so decoding them cannot fail
+        result = {word.decode("ascii"): count for word, count in word_counts.items()}
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+
+
+CountUniqueWords.cli()
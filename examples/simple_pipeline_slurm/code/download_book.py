@@ -0,0 +1,54 @@
+import asyncio
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from tigerflow.tasks import LocalAsyncTask
+from tigerflow.utils import SetupContext
+
+CHUNK_SIZE = 64 * 1024
+
+
+class DownloadBook(LocalAsyncTask):
+    class Params:
+        simulate_work: Annotated[
+            bool,
+            typer.Option(
+                "--simulate-work",
+                help="Sleep for a few seconds per file to simulate a long-running request",
+            ),
+        ] = False
+
+    @staticmethod
+    async def setup(context: SetupContext):
+        import aiohttp
+
+        context.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=120),
+            read_bufsize=1 << 20,
+        )
+        print("Session created successfully!")
+
+    @staticmethod
+    async def run(context: SetupContext, input_file: Path, output_file: Path):
+        import aiofiles
+
+        book_id = input_file.stem
+        async with context.session.get(
+            f"https://www.gutenberg.org/cache/epub/{book_id}/pg{book_id}.txt"
+        ) as resp:
+            if context.simulate_work:
+                await asyncio.sleep(5)
+            # Stream raw bytes to disk rather than buffering the decoded text
+            async with aiofiles.open(output_file, "wb") as f:
+                async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                    await f.write(chunk)
+
+    @staticmethod
+    async def teardown(context: SetupContext):
+        await context.session.close()
+        print("Session closed successfully!")
+
+
+DownloadBook.cli()
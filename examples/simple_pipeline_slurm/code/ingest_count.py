@@ -0,0 +1,85 @@
+import json
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from tigerflow.tasks import LocalTask
+from tigerflow.utils import SetupContext
+
+DB_PATH = Path(__file__).parent.parent / "results" / "test.db"
+
+
+class Ingest(LocalTask):
+    class Params:
+        batch_size: Annotated[
+            int,
+            typer.Option(help="Number of rows to buffer per transaction"),
+        ] = 500
+
+    @staticmethod
+    def setup(context: SetupContext):
+        import sqlite3
+
+        conn = sqlite3.connect(DB_PATH)  # Creates file if not existing
+        print(f"Successfully connected to {DB_PATH}")
+
+        # Avoid an fsync per commit; WAL keeps the database consistent on crash
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS books (
+                id INTEGER PRIMARY KEY,
+                unique_word_count INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+
+        context.conn = conn
+        context.rows = {}  # Word counts awaiting a bulk insert, by book ID
+
+    @staticmethod
+    def flush(context: SetupContext):
+        if not context.rows:
+            return
+        try:
+            with context.conn:  # Single transaction for the whole batch
+                context.conn.executemany(
+                    "INSERT INTO books (id, unique_word_count) VALUES (?, ?)",
+                    context.rows.items(),
+                )
+            print(f"Inserted {len(context.rows)} rows")
+        finally:
+            # Never retry a failed batch, or every later file would fail too
+            context.rows.clear()
+
+    @staticmethod
+    def run(context: SetupContext, input_file: Path, output_file: Path):
+        with open(input_file) as f:
+            content = json.load(f)
+
+        assert isinstance(content, dict)
+
+        # Reject duplicates here so that the offending file fails on its own,
+        # rather than the whole batch failing when it is inserted later
+        book_id = int(input_file.stem)
+        if book_id in context.rows or context.conn.execute(
+            "SELECT 1 FROM books WHERE id = ?", (book_id,)
+        ).fetchone():
+            raise ValueError(f"Book {book_id} has already been ingested")
+
+        context.rows[book_id] = len(content)
+        if len(context.rows) >= context.batch_size:
+            Ingest.flush(context)
+
+    @staticmethod
+    def teardown(context: SetupContext):
+        try:
+            Ingest.flush(context)  # Insert any remaining rows
+        finally:
+            context.conn.close()
+            print("DB connection closed")
+
+
+Ingest.cli()
@@ -1,5 +1,14 @@
-from .cli import app
-
-
 def main():
+    from .cli import app
+
     app()
+
+
+def __getattr__(name: str):
+    # The CLI is loaded on first use so that importing task modules (e.g.,
+    # `python -m tigerflow.library.echo`) does not pull in every command
+    if name == "app":
+        from .cli import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,16 @@
 import json
 import time
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
 
 from tigerflow.models import FileMetrics, PipelineOutput, PipelineReport
 
+# rich is imported on first use to keep it off the JSON output path
+if TYPE_CHECKING:
+    from rich.panel import Panel
+
 
 def _make_sparkline(values: list[int | float], width: int = 20) -> str:
     """Create a sparkline using Unicode blocks ▁▂▃▄▅▆▇█"""
@@ -74,8 +75,9 @@ def _compute_metrics_summary(metrics: dict[str, list[FileMetrics]]) -> dict:
     }
 
 
-def _build_dashboard_panel(report: PipelineReport) -> Panel:
+def _build_dashboard_panel(report: PipelineReport) -> "Panel":
     """Build the dashboard panel."""
+    from rich.panel import Panel
 
     def fmt_duration(ms: float) -> str:
         if ms >= 1000:
@@ -264,14 +266,21 @@ def report(
         if use_json:
             print(json.dumps({"error": str(e)}))
         else:
+            from rich.console import Console
+
             Console().print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
 
     if watch and use_json:
+        from rich.console import Console
+
         Console().print("[red]Error: --watch cannot be used with --json[/red]")
         raise typer.Exit(1)
 
     if watch:
+        from rich.console import Console
+        from rich.live import Live
+
         console = Console(highlight=False)
         with Live(console=console, refresh_per_second=1) as live:
             try:
@@ -338,6 +347,8 @@ def report(
 
         print(json.dumps(result, indent=2, default=str))
     else:
+        from rich.console import Console
+
         pipeline_report = output.report()
         console = Console(highlight=False)
         panel = _build_dashboard_panel(pipeline_report)
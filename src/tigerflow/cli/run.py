@@ -6,8 +6,7 @@ from typing import Annotated
 import typer
 
 from tigerflow.models import PipelineOutput
-from tigerflow.pipeline import Pipeline
-from tigerflow.utils import has_running_pid, read_pid_file
+from tigerflow.utils import read_and_probe_pid
 
 
 def run(
@@ -57,11 +56,14 @@ def run(
     """
     Run a pipeline based on the given specification.
     """
+    # Imported here so that other commands don't pay for the pipeline's imports
+    from tigerflow.pipeline import Pipeline
+
     output = PipelineOutput(output_dir)
     output.create()
 
-    if has_running_pid(output.pid_file):
-        pid = read_pid_file(output.pid_file)
+    pid, running = read_and_probe_pid(output.pid_file)
+    if running:
         typer.echo(f"Error: Pipeline is already running (pid {pid})", err=True)
         raise typer.Exit(1)
 
@@ -116,6 +118,8 @@ def _run_in_background(
     os.dup2(devnull, sys.stderr.fileno())
     os.close(devnull)
 
+    from tigerflow.pipeline import Pipeline  # Already loaded by run()
+
     pipeline = Pipeline(
         config_file=config_file,
         input_dir=input_dir,
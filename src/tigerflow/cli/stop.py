@@ -6,7 +6,7 @@ from typing import Annotated
 import typer
 
 from tigerflow.models import PipelineOutput
-from tigerflow.utils import is_process_running, read_pid_file
+from tigerflow.utils import read_and_probe_pid
 
 
 def stop(
@@ -37,12 +37,12 @@ def stop(
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1)
 
-    pid = read_pid_file(output.pid_file)
+    pid, running = read_and_probe_pid(output.pid_file)
     if pid is None:
         typer.echo("Pipeline is not running (no PID file)")
         raise typer.Exit(0)
 
-    if not is_process_running(pid):
+    if not running:
         typer.echo(f"Pipeline is not running (stale PID file, pid {pid})")
         output.pid_file.unlink(missing_ok=True)
         raise typer.Exit(0)
@@ -1,13 +1,17 @@
 """CLI commands for managing and discovering tasks."""
 
+import ast
+import functools
 import importlib
+import importlib.util
 import json
 import pkgutil
+import textwrap
+from collections.abc import Iterable
 from importlib.metadata import entry_points, packages_distributions, version
 from typing import Annotated
 
 import typer
-from rich import print
 
 app = typer.Typer()
 
@@ -36,28 +40,45 @@ def list_tasks(
 
 
 def _list_tasks_json(builtin: list[tuple[str, str]], installed: list[tuple[str, str]]):
-    """Output task list in JSON format."""
-    data = {
-        "builtin": [
-            {
-                "name": name,
-                "module": module_name,
-                "version": _get_package_version(module_name),
-                "description": _get_task_description(module_name),
-            }
-            for name, module_name in sorted(builtin)
-        ],
-        "installed": [
-            {
-                "name": name,
-                "module": module_path,
-                "version": _get_package_version(module_path.split(":")[0]),
-                "description": _get_task_description(module_path),
-            }
-            for name, module_path in sorted(installed)
-        ],
-    }
-    typer.echo(json.dumps(data, indent=2))
+    """Output task list in JSON format.
+
+    Entries are written as soon as their metadata is resolved, rather than
+    after every task module has been inspected.
+    """
+    builtin_entries = (
+        {
+            "name": name,
+            "module": module_name,
+            "version": _get_package_version(module_name),
+            "description": _get_task_description(module_name),
+        }
+        for name, module_name in sorted(builtin)
+    )
+    installed_entries = (
+        {
+            "name": name,
+            "module": module_path,
+            "version": _get_package_version(module_path.split(":")[0]),
+            "description": _get_task_description(module_path),
+        }
+        for name, module_path in sorted(installed)
+    )
+    typer.echo("{")
+    _echo_json_list("builtin", builtin_entries, last=False)
+    _echo_json_list("installed", installed_entries, last=True)
+    typer.echo("}")
+
+
+def _echo_json_list(key: str, entries: Iterable[dict], last: bool):
+    """Write a top-level list member, formatted as json.dumps(..., indent=2)."""
+    typer.echo(f"  {json.dumps(key)}: [", nl=False)
+    separator = "\n"
+    for entry in entries:
+        entry_json = textwrap.indent(json.dumps(entry, indent=2), "    ")
+        typer.echo(separator + entry_json, nl=False)
+        separator = ",\n"
+    closing = "]" if separator == "\n" else "\n  ]"  # Inline if empty
+    typer.echo(closing if last else closing + ",")
 
 
 def _list_tasks_rich(
@@ -66,6 +87,8 @@ def _list_tasks_rich(
     verbose: bool,
 ):
     """Output task list with rich formatting."""
+    from rich import print
+
     if not builtin and not installed:
         print("No tasks found.")
         return
@@ -110,6 +133,8 @@ def task_info(
     """
     Show detailed information about a task.
     """
+    from rich import print
+
     # Check built-in tasks first
     builtin = {name: module for name, module in _get_builtin_tasks()}
     installed = {name: module for name, module in _get_installed_tasks()}
@@ -135,7 +160,7 @@ def task_info(
     # Try to get the task class and its Params
     try:
         module_path, class_name = _parse_module_path(module_name)
-        module = importlib.import_module(module_path)
+        module = _import_module(module_path)
         if module.__doc__:
             print(f"\nDescription:\n{module.__doc__.strip()}")
 
@@ -168,17 +193,21 @@ def task_info(
 
 def _get_package_version(module_name: str) -> str | None:
     """Get the version of the package that provides a module."""
+    # Get the top-level package name
+    return _get_top_level_version(module_name.split(".")[0])
+
+
+@functools.cache
+def _get_top_level_version(top_level: str) -> str | None:
+    """Get the version of the distribution that provides a top-level package."""
     try:
-        # Get the top-level package name
-        top_level = module_name.split(".")[0]
         # Try direct version lookup first (works for most packages)
         return version(top_level)
     except Exception:
         pass
     try:
         # Fall back to packages_distributions mapping
-        pkg_dist = packages_distributions()
-        top_level = module_name.split(".")[0]
+        pkg_dist = _get_packages_distributions()
         if top_level in pkg_dist:
             dist_name = pkg_dist[top_level][0]
             return version(dist_name)
@@ -187,6 +216,13 @@ def _get_package_version(module_name: str) -> str | None:
     return None
 
 
+@functools.cache
+def _get_packages_distributions() -> dict[str, list[str]]:
+    """Map top-level packages to distributions, scanning installed metadata once."""
+    return packages_distributions()
+
+
+@functools.cache
 def _get_builtin_tasks() -> list[tuple[str, str]]:
     """Get list of built-in tasks from tigerflow.library."""
     tasks = []
@@ -202,6 +238,7 @@ def _get_builtin_tasks() -> list[tuple[str, str]]:
     return tasks
 
 
+@functools.cache
 def _get_installed_tasks() -> list[tuple[str, str]]:
     """Get list of tasks installed via entry points."""
     tasks = []
@@ -222,17 +259,39 @@ def _parse_module_path(module_path: str) -> tuple[str, str | None]:
     return module_path, None
 
 
+@functools.cache
 def _get_task_description(module_path: str) -> str | None:
     """Try to get a task's description from its docstring."""
     try:
         module_name, _ = _parse_module_path(module_path)
-        module = importlib.import_module(module_name)
-        if module.__doc__:
+        try:
+            doc = _read_module_docstring(module_name)
+        except Exception:
+            doc = _import_module(module_name).__doc__
+        if doc:
             # Get first non-empty line of docstring
-            for line in module.__doc__.strip().split("\n"):
+            for line in doc.strip().split("\n"):
                 line = line.strip()
                 if line:
                     return line
     except Exception:
         pass
     return None
+
+
+def _read_module_docstring(module_name: str) -> str | None:
+    """Read a module's docstring from its source without executing the module.
+
+    Raises if the module's source cannot be located or parsed.
+    """
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.origin is None or not spec.origin.endswith(".py"):
+        raise ImportError(f"No Python source found for module '{module_name}'")
+    with open(spec.origin, "rb") as f:
+        return ast.get_docstring(ast.parse(f.read()))
+
+
+@functools.cache
+def _import_module(module_name: str):
+    """Import a module once, reusing it across lookups."""
+    return importlib.import_module(module_name)
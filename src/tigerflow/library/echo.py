@@ -13,6 +13,7 @@ Usage:
         --suffix " :End"
 """
 
+import shutil
 from pathlib import Path
 from typing import Annotated
 
@@ -21,6 +22,8 @@ import typer
 from tigerflow.tasks import LocalTask
 from tigerflow.utils import SetupContext
 
+COPY_BUFSIZE = 8 * 1024 * 1024
+
 
 class Echo(LocalTask):
     """Copy input files to output with optional prefix/suffix."""
@@ -41,16 +44,28 @@ class Echo(LocalTask):
 
     @staticmethod
     def run(context: SetupContext, input_file: Path, output_file: Path):
-        with open(input_file) as f:
-            content = f.read()
-
-        if context.uppercase:
-            content = content.upper()
-
-        result = f"{context.prefix}{content}{context.suffix}"
+        if not context.uppercase:
+            if not context.prefix and not context.suffix:
+                # Plain copy, done in the kernel where supported
+                shutil.copyfile(input_file, output_file)
+                return
+            # Stream the content between prefix and suffix
+            with open(input_file, "rb") as fin, open(output_file, "wb") as fout:
+                fout.write(context.prefix.encode())
+                shutil.copyfileobj(fin, fout, COPY_BUFSIZE)
+                fout.write(context.suffix.encode())
+            return
 
-        with open(output_file, "w") as f:
-            f.write(result)
+        # Uppercase chunk by chunk so that memory use stays bounded; text mode
+        # keeps non-ASCII case mapping, and newline="" keeps line endings
+        with (
+            open(input_file, newline="") as fin,
+            open(output_file, "w", newline="") as fout,
+        ):
+            fout.write(context.prefix)
+            while chunk := fin.read(COPY_BUFSIZE):
+                fout.write(chunk.upper())
+            fout.write(context.suffix)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,55 @@
 import json
+import os
 import re
 import shlex
-import textwrap
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
-import networkx as nx
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from tigerflow.settings import settings
 from tigerflow.staging import StagingPipeline
 from tigerflow.utils import (
     TEMP_FILE_PREFIX,
-    is_process_running,
-    read_pid_file,
+    read_and_probe_pid,
     validate_file_ext,
 )
 
+# Script templates are kept flush-left so that no dedent pass is needed
+# when scripts are rendered
+
+_LOCAL_SCRIPT_TEMPLATE = """\
+#!/bin/bash
+{setup_command}
+{task_command} > {stdout_file} 2> {stderr_file}
+"""
+
+_SLURM_SCRIPT_TEMPLATE = """\
+#!/bin/bash
+#SBATCH --job-name={job_name}
+#SBATCH --output={log_dir}/task-client-%j.out
+#SBATCH --error={log_dir}/task-client-%j.log
+#SBATCH --nodes=1
+#SBATCH --ntasks=1
+#SBATCH --cpus-per-task=1
+#SBATCH --mem-per-cpu=2G
+#SBATCH --time={job_time}
+{sbatch_account}
+
+echo "Starting Dask client for: {name}"
+echo "With SLURM_JOB_ID: $SLURM_JOB_ID"
+echo "On machine:" $(hostname)
+
+{setup_command}
+
+{task_command}
+"""
+
 
 class TaskStatusKind(Enum):
     ACTIVE = "active"
@@ -71,9 +102,9 @@ class BaseTaskConfig(BaseModel):
     output_ext: str = ".out"
     keep_output: bool = True
     setup_commands: list[str] = []
-    _input_dir: Path | None = None
-    _output_dir: Path | None = None
-    _runner_pid: int | None = None
+    _input_dir: Path | None = PrivateAttr(default=None)
+    _output_dir: Path | None = PrivateAttr(default=None)
+    _runner_pid: int | None = PrivateAttr(default=None)
 
     @field_validator("name")
     @classmethod
@@ -92,12 +123,16 @@ class BaseTaskConfig(BaseModel):
         from importlib.util import find_spec
 
         if module.endswith(".py"):
-            path = Path(module)
-            if not path.exists():
+            # Resolving strictly checks existence, so one stat settles the rest.
+            # Before Python 3.13, a symlink loop raises RuntimeError, not OSError.
+            try:
+                path = Path(module).resolve(strict=True)
+                is_file = stat.S_ISREG(path.stat().st_mode)
+            except (OSError, RuntimeError):
                 raise ValueError(f"Module does not exist: {module}")
-            if not path.is_file():
+            if not is_file:
                 raise ValueError(f"Module is not a file: {module}")
-            return str(path.resolve())  # Use absolute path for clarity
+            return str(path)  # Use absolute path for clarity
         else:
             try:
                 if find_spec(module) is None:
@@ -114,6 +149,12 @@ class BaseTaskConfig(BaseModel):
         else:
             return f"python -m {self.module}"
 
+    @cached_property
+    def setup_command(self) -> str:
+        """Return the setup commands joined into a single shell line."""
+        # Setup commands are fixed once validated, so join them only once
+        return ";".join(self.setup_commands)
+
     @staticmethod
     def _serialize_param(value: object) -> str:
         """Serialize a single scalar param value to a shell-safe CLI string.
@@ -217,7 +258,6 @@ class LocalTaskConfig(BaseTaskConfig):
     def to_script(self) -> str:
         stdout_file = self.log_dir / "task-$$.out"
         stderr_file = self.log_dir / "task-$$.log"
-        setup_command = ";".join(self.setup_commands)
         task_command = " ".join(
             [
                 "exec",
@@ -227,17 +267,16 @@ class LocalTaskConfig(BaseTaskConfig):
                 f"--input-ext={self.input_ext}",
                 f"--output-dir={self.output_dir}",
                 f"--output-ext={self.output_ext}",
+                *self.params_as_cli_args,
             ]
-            + self.params_as_cli_args
         )
 
-        script = textwrap.dedent(f"""\
-            #!/bin/bash
-            {setup_command}
-            {task_command} > {stdout_file} 2> {stderr_file}
-        """)
-
-        return script
+        return _LOCAL_SCRIPT_TEMPLATE.format(
+            setup_command=self.setup_command,
+            task_command=task_command,
+            stdout_file=stdout_file,
+            stderr_file=stderr_file,
+        )
 
 
 class LocalAsyncTaskConfig(BaseTaskConfig):
@@ -247,7 +286,6 @@ class LocalAsyncTaskConfig(BaseTaskConfig):
     def to_script(self) -> str:
         stdout_file = self.log_dir / "task-$$.out"
         stderr_file = self.log_dir / "task-$$.log"
-        setup_command = ";".join(self.setup_commands)
         task_command = " ".join(
             [
                 "exec",
@@ -258,17 +296,16 @@ class LocalAsyncTaskConfig(BaseTaskConfig):
                 f"--output-dir={self.output_dir}",
                 f"--output-ext={self.output_ext}",
                 f"--concurrency-limit={self.concurrency_limit}",
+                *self.params_as_cli_args,
             ]
-            + self.params_as_cli_args
         )
 
-        script = textwrap.dedent(f"""\
-            #!/bin/bash
-            {setup_command}
-            {task_command} > {stdout_file} 2> {stderr_file}
-        """)
-
-        return script
+        return _LOCAL_SCRIPT_TEMPLATE.format(
+            setup_command=self.setup_command,
+            task_command=task_command,
+            stdout_file=stdout_file,
+            stderr_file=stderr_file,
+        )
 
 
 class SlurmTaskConfig(BaseTaskConfig):
@@ -302,60 +339,44 @@ class SlurmTaskConfig(BaseTaskConfig):
             "",
         )
 
-        setup_command = ";".join(self.setup_commands)
-        task_command = " ".join(
-            [
-                self.python_command,
-                f"--task-name={self.name}",
-                f"--input-dir={self.input_dir}",
-                f"--input-ext={self.input_ext}",
-                f"--output-dir={self.output_dir}",
-                f"--output-ext={self.output_ext}",
-                f"--max-workers={self.max_workers}",
-                f"--cpus={self.worker_resources.cpus}",
-                f"--memory={self.worker_resources.memory}",
-                f"--time={self.worker_resources.time}",
-                f"--gpus={self.worker_resources.gpus}"
-                if self.worker_resources.gpus
-                else "",
-                "--run-directly",
-                f"--runner-pid={self.runner_pid}"
-                if self.runner_pid is not None
-                else "",
-            ]
-            + [
-                f"--sbatch-option={shlex.quote(option)}"
-                for option in self.worker_resources.sbatch_options
-            ]
-            + [
-                f"--setup-command={shlex.quote(command)}"
-                for command in self.setup_commands
-            ]
-            + self.params_as_cli_args
+        args = [
+            self.python_command,
+            f"--task-name={self.name}",
+            f"--input-dir={self.input_dir}",
+            f"--input-ext={self.input_ext}",
+            f"--output-dir={self.output_dir}",
+            f"--output-ext={self.output_ext}",
+            f"--max-workers={self.max_workers}",
+            f"--cpus={self.worker_resources.cpus}",
+            f"--memory={self.worker_resources.memory}",
+            f"--time={self.worker_resources.time}",
+        ]
+        # Append optional flags only when set, so no empty arguments end up
+        # as stray spaces in the command
+        if self.worker_resources.gpus:
+            args.append(f"--gpus={self.worker_resources.gpus}")
+        args.append("--run-directly")
+        if self.runner_pid is not None:
+            args.append(f"--runner-pid={self.runner_pid}")
+        args.extend(
+            f"--sbatch-option={shlex.quote(option)}"
+            for option in self.worker_resources.sbatch_options
+        )
+        args.extend(
+            f"--setup-command={shlex.quote(command)}" for command in self.setup_commands
+        )
+        args.extend(self.params_as_cli_args)
+        task_command = " ".join(args)
+
+        return _SLURM_SCRIPT_TEMPLATE.format(
+            job_name=self.client_job_name,
+            log_dir=self.log_dir,
+            job_time=self.client_job_time,
+            sbatch_account=sbatch_account,
+            name=self.name,
+            setup_command=self.setup_command,
+            task_command=task_command,
         )
-
-        script = textwrap.dedent(f"""\
-            #!/bin/bash
-            #SBATCH --job-name={self.client_job_name}
-            #SBATCH --output={self.log_dir}/task-client-%j.out
-            #SBATCH --error={self.log_dir}/task-client-%j.log
-            #SBATCH --nodes=1
-            #SBATCH --ntasks=1
-            #SBATCH --cpus-per-task=1
-            #SBATCH --mem-per-cpu=2G
-            #SBATCH --time={self.client_job_time}
-            {sbatch_account}
-
-            echo "Starting Dask client for: {self.name}"
-            echo "With SLURM_JOB_ID: $SLURM_JOB_ID"
-            echo "On machine:" $(hostname)
-
-            {setup_command}
-
-            {task_command}
-        """)
-
-        return script
 
 
 TaskConfig = Annotated[
@@ -381,14 +402,13 @@ class PipelineConfig(BaseModel):
             raise ValueError("Pipeline must have at least one task")
 
         # Validate task names are unique
-        seen_names = set()
+        task_dict: dict[str, TaskConfig] = {}
         for task in tasks:
-            if task.name in seen_names:
+            if task.name in task_dict:
                 raise ValueError(f"Duplicate task name: {task.name}")
-            seen_names.add(task.name)
+            task_dict[task.name] = task
 
         # Validate dependency references and extension compatibility
-        task_dict = {task.name: task for task in tasks}
         for task in tasks:
             if not task.depends_on:
                 continue
@@ -404,33 +424,39 @@ class PipelineConfig(BaseModel):
                     f"its dependent task '{task.name}' expects '{task.input_ext}'"
                 )
 
-        # Build the task dependency graph
-        G = nx.DiGraph()
+        # Each task has at most one parent, so the graph is an arborescence
+        # (forest) exactly when every task is reachable from a root task
+        children: dict[str, list[str]] = {task.name: [] for task in tasks}
+        roots: list[str] = []
         for task in tasks:
-            G.add_node(task.name)
             if task.depends_on:
-                G.add_edge(task.depends_on, task.name)
+                children[task.depends_on].append(task.name)
+            else:
+                roots.append(task.name)
+
+        # Sort tasks in tree order (DFS pre-order from roots)
+        order_map: dict[str, int] = {}
+        stack = roots[::-1]
+        while stack:
+            name = stack.pop()
+            order_map[name] = len(order_map)
+            stack.extend(reversed(children[name]))
 
         # Validate the graph of input/output files forms an arborescence
-        if not nx.is_branching(G):
+        if len(order_map) != len(tasks):
             raise ValueError("Task dependency graph contains a cycle")
         root_input_ext = {task.input_ext for task in tasks if not task.depends_on}
         if len(root_input_ext) > 1:  # Cannot be zero due to earlier validations
             raise ValueError("Root tasks must have the same input extension")
 
-        # Sort tasks in tree order (DFS pre-order from roots)
-        roots = [n for n in G if G.in_degree(n) == 0]
-        order_map = {
-            name: index
-            for index, name in enumerate(
-                node for root in roots for node in nx.dfs_preorder_nodes(G, root)
-            )
-        }
         tasks.sort(key=lambda task: order_map[task.name])
 
         return tasks
 
-    @property
+    # The task graph is fixed once validated, so derived views are computed
+    # on first access and reused by the pipeline's polling loop
+
+    @cached_property
     def root_input_ext(self) -> str:
         # Assumes all root tasks share the same input extension
         for task in self.tasks:
@@ -438,11 +464,11 @@ class PipelineConfig(BaseModel):
                 return task.input_ext
         raise ValueError("No root task found")
 
-    @property
+    @cached_property
     def root_tasks(self) -> list[TaskConfig]:
         return [task for task in self.tasks if not task.depends_on]
 
-    @property
+    @cached_property
     def terminal_tasks(self) -> list[TaskConfig]:
         parents = {task.depends_on for task in self.tasks if task.depends_on}
         return [task for task in self.tasks if task.name not in parents]
@@ -523,17 +549,17 @@ class PipelineOutput:
 
     def _get_status(self) -> tuple[bool, int | None]:
         """Return (is_running, pid)."""
-        pid = read_pid_file(self.pid_file)
-        is_running = pid is not None and is_process_running(pid)
+        pid, is_running = read_and_probe_pid(self.pid_file)
         return is_running, pid if is_running else None
 
     def _get_task_dirs(self) -> list[Path]:
         """Get all task directories (non-hidden dirs in .tigerflow)."""
-        return [
-            d
-            for d in self.internal.iterdir()
-            if d.is_dir() and not d.name.startswith(".")
-        ]
+        with os.scandir(self.internal) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            ]
 
     def _get_task_meta(self) -> list[TaskMeta]:
         """Get task metadata from the most recent INIT entry in run.log."""
@@ -595,6 +621,49 @@ class PipelineOutput:
 
         return metrics
 
+    @staticmethod
+    def _scan_task_dir(
+        task_dir: Path,
+    ) -> tuple[list[FileError], set[str], set[str]]:
+        """Classify a task directory's files in a single pass.
+
+        Returns (errors, failed stems, stems with any other output file).
+        """
+        err_files: list[Path] = []
+        output_stems: set[str] = set()
+        with os.scandir(task_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(TEMP_FILE_PREFIX):
+                    continue
+                if not entry.is_file():
+                    continue
+                if name.endswith(".err"):
+                    err_files.append(Path(entry.path))
+                else:
+                    output_stems.add(os.path.splitext(name)[0])
+
+        errors: list[FileError] = []
+        failed_stems: set[str] = set()
+        for file in err_files:
+            stem = file.name.removesuffix(".err")
+            failed_stems.add(stem)
+            try:
+                data = json.loads(file.read_text())
+                errors.append(
+                    FileError(
+                        file=data.get("file", stem),
+                        path=str(file),
+                        timestamp=datetime.fromisoformat(data["timestamp"]),
+                        exception_type=data.get("exception_type", ""),
+                        message=data.get("message", ""),
+                        traceback=data.get("traceback", ""),
+                    )
+                )
+            except (OSError, json.JSONDecodeError, KeyError):
+                errors.append(FileError(file=stem, path=str(file)))
+        return errors, failed_stems, output_stems
+
     def report(self) -> PipelineReport:
         """Generate a complete pipeline status report."""
         self.validate()
@@ -603,64 +672,53 @@ class PipelineOutput:
 
         # === Filesystem Counts ===
 
+        # Directory entries are classified via scandir's cached d_type rather
+        # than a stat() per file, which dominates on large pipelines; only
+        # symlinks still cost a stat, as they are followed
+
         # processed = files in .finished/
         finished_stems: set[str] = set()
         if self.finished.exists():
-            finished_stems = {f.stem for f in self.finished.iterdir() if f.is_file()}
+            with os.scandir(self.finished) as entries:
+                finished_stems = {
+                    os.path.splitext(entry.name)[0]
+                    for entry in entries
+                    if entry.is_file()
+                }
 
         # failed = unique .err stems across all task dirs
+        # stems_with_output = stems with any other task output file
         failed_stems: set[str] = set()
+        stems_with_output: set[str] = set()
         errors: dict[str, list[FileError]] = {}
-        for task_dir in self._get_task_dirs():
-            task_errors: list[FileError] = []
-            for file in task_dir.iterdir():
-                if (
-                    file.is_file()
-                    and file.name.endswith(".err")
-                    and not file.name.startswith(TEMP_FILE_PREFIX)
-                ):
-                    stem = file.name.removesuffix(".err")
-                    failed_stems.add(stem)
-                    try:
-                        data = json.loads(file.read_text())
-                        task_errors.append(
-                            FileError(
-                                file=data.get("file", stem),
-                                path=str(file),
-                                timestamp=datetime.fromisoformat(data["timestamp"]),
-                                exception_type=data.get("exception_type", ""),
-                                message=data.get("message", ""),
-                                traceback=data.get("traceback", ""),
-                            )
-                        )
-                    except (OSError, json.JSONDecodeError, KeyError):
-                        task_errors.append(FileError(file=stem, path=str(file)))
+        task_dirs = self._get_task_dirs()
+        if len(task_dirs) > 2:
+            # Overlap directory reads across tasks, which helps most on
+            # network filesystems where each read has high latency
+            with ThreadPoolExecutor(max_workers=min(8, len(task_dirs))) as executor:
+                scans = list(executor.map(self._scan_task_dir, task_dirs))
+        else:
+            scans = [self._scan_task_dir(task_dir) for task_dir in task_dirs]
+        for task_dir, (task_errors, task_failed, task_output) in zip(task_dirs, scans):
+            failed_stems |= task_failed
+            stems_with_output |= task_output
             if task_errors:
                 errors[task_dir.name] = task_errors
 
         # Get symlink stems (excluding finished and failed)
         symlink_stems: set[str] = set()
         if self.symlinks.exists():
-            symlink_stems = {
-                f.stem
-                for f in self.symlinks.iterdir()
-                if f.is_symlink()
-                and f.stem not in finished_stems
-                and f.stem not in failed_stems
-            }
+            with os.scandir(self.symlinks) as entries:
+                symlink_stems = {
+                    stem
+                    for entry in entries
+                    if entry.is_symlink()
+                    and (stem := os.path.splitext(entry.name)[0]) not in finished_stems
+                    and stem not in failed_stems
+                }
 
         # in_progress = symlinks with any task output file
         # staged = symlinks without any task output file
-        stems_with_output: set[str] = set()
-        for task_dir in self._get_task_dirs():
-            for file in task_dir.iterdir():
-                if (
-                    file.is_file()
-                    and not file.name.endswith(".err")
-                    and not file.name.startswith(TEMP_FILE_PREFIX)
-                ):
-                    stems_with_output.add(file.stem)
-
         in_progress_stems = symlink_stems & stems_with_output
         staged_stems = symlink_stems - stems_with_output
 
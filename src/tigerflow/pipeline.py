@@ -6,6 +6,7 @@ import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from types import FrameType
@@ -23,9 +24,17 @@ from tigerflow.models import (
 )
 from tigerflow.settings import settings
 from tigerflow.staging import StagingContext
-from tigerflow.tasks.utils import get_slurm_task_status
+from tigerflow.tasks.utils import get_slurm_task_statuses
 from tigerflow.utils import TEMP_FILE_PREFIX, submit_to_slurm, validate_task_cli
 
+# How long, by the local clock, two scans must be apart to confirm that a
+# directory's mtime is stable; coarse (e.g., 1 s) timestamps on some
+# filesystems may not advance for an entry added in the same tick as a scan
+DIR_MTIME_SETTLE_NS = 2_000_000_000
+
+# Prefer the libyaml-backed loader, which parses several times faster
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Pipeline:
     @logger.catch(reraise=True)
@@ -63,7 +72,7 @@ class Pipeline:
         self._delete_input = delete_input
 
         self._config = PipelineConfig.model_validate(
-            yaml.safe_load(config_file.read_text())
+            yaml.load(config_file.read_text(), Loader=YAML_LOADER)
         )
 
         for task in self._config.tasks:
@@ -85,45 +94,53 @@ class Pipeline:
                 self._output_dir.joinpath(task.name).mkdir(exist_ok=True)
 
         # Collect file IDs that need cleanup
-        finished_ids = set()
-        for file in self._finished_dir.iterdir():
-            file_id = file.name.removesuffix(self._config.root_input_ext)
-            finished_ids.add(file_id)
+        finished_ids = {
+            filename.removesuffix(self._config.root_input_ext)
+            for filename in os.listdir(self._finished_dir)
+        }
         cleanup_ids = set(finished_ids)
-        for file in self._symlinks_dir.iterdir():
-            if not file.is_symlink():
-                file.unlink()
-            else:
-                file_id = file.name.removesuffix(self._config.root_input_ext)
-                if not file.exists() or file_id in finished_ids:
-                    file.unlink()
-                    cleanup_ids.add(file_id)
-
-        # Remove orphaned task outputs and input files
-        for file_id in cleanup_ids:
-            for task in self._config.tasks:
-                task_file = task.output_dir / f"{file_id}{task.output_ext}"
-                task_file.unlink(missing_ok=True)
-            if self._delete_input:
-                filename = f"{file_id}{self._config.root_input_ext}"
-                self._input_dir.joinpath(filename).unlink(missing_ok=True)
-
-        # Clean up any invalid or unsuccessful task outputs
+        with os.scandir(self._symlinks_dir) as entries:
+            for entry in entries:
+                # The entry type comes from the listing; only a symlink's
+                # target needs a stat to tell whether it still exists
+                if not entry.is_symlink():
+                    os.unlink(entry.path)
+                else:
+                    file_id = entry.name.removesuffix(self._config.root_input_ext)
+                    if file_id in finished_ids or not os.path.exists(entry.path):
+                        os.unlink(entry.path)
+                        cleanup_ids.add(file_id)
+
+        # Remove orphaned input files. The directories are listed once each
+        # rather than probing every cleanup ID, since .finished keeps growing
+        # across runs while most of its files are long gone.
+        if self._delete_input:
+            ext = self._config.root_input_ext
+            with os.scandir(self._input_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(ext) and name.removesuffix(ext) in cleanup_ids:
+                        os.unlink(entry.path)
+
+        # Remove orphaned task outputs and any invalid or unsuccessful ones
         for task in self._config.tasks:
-            for file in task.output_dir.iterdir():
-                if file.is_file() and (
-                    not file.name.endswith(task.output_ext)
-                    or file.name.startswith(TEMP_FILE_PREFIX)
-                ):
-                    file.unlink()
+            ext = task.output_ext
+            with os.scandir(task.output_dir) as entries:
+                for entry in entries:
+                    # Name checks first, so valid outputs need no type lookup
+                    name = entry.name
+                    if (
+                        not name.endswith(ext)
+                        or name.startswith(TEMP_FILE_PREFIX)
+                        or name.removesuffix(ext) in cleanup_ids
+                    ) and entry.is_file():
+                        os.unlink(entry.path)
 
         # Initialize a set to track files being processed or already processed
-        self._filenames = {
-            file.name
-            for dir in (self._symlinks_dir, self._finished_dir)
-            for file in dir.iterdir()
-            if file.is_file()
-        }
+        self._filenames = set()
+        for dir in (self._symlinks_dir, self._finished_dir):
+            with os.scandir(dir) as entries:
+                self._filenames.update(e.name for e in entries if e.is_file())
 
         # Initialize mapping to track failed files per task
         self._task_error_filenames: dict[str, set[str]] = {
@@ -137,6 +154,16 @@ class Pipeline:
             task.name: set() for task in self._config.tasks
         }
 
+        # Initialize mapping to track, per terminal task, IDs of files it has
+        # processed that are still awaiting other terminal tasks
+        self._terminal_pending_ids: dict[str, set[str]] = {
+            task.name: set() for task in self._config.terminal_tasks
+        }
+
+        # Initialize mapping from (purpose, directory) to the mtime its last
+        # scan saw, when scans first saw it, and whether it is confirmed stable
+        self._scanned_mtimes: dict[tuple[str, Path], tuple[int, int, bool]] = dict()
+
         # Initialize mapping from task name to status
         self._task_status: dict[str, TaskStatus] = {
             task.name: TaskStatus(kind=TaskStatusKind.INACTIVE)
@@ -183,9 +210,22 @@ class Pipeline:
             logger.info("Starting pipeline execution")
             self._start_tasks()
             logger.info("All tasks started, beginning pipeline tracking loop")
+            idle_cycles, last_task_check = 0, float("-inf")
             while not self._shutdown_event.is_set():
-                self._run_tracking_cycle()
-                self._shutdown_event.wait(timeout=settings.pipeline_poll_interval)
+                # Task status checks (e.g., squeue calls) keep the configured
+                # interval; only the filesystem work below polls sooner
+                now = time.monotonic()
+                check_tasks = now - last_task_check >= settings.pipeline_poll_interval
+                if check_tasks:
+                    last_task_check = now
+                progressed = self._run_tracking_cycle(check_tasks=check_tasks)
+                idle_cycles = 0 if progressed else idle_cycles + 1
+                # Poll files again soon while they are moving through the
+                # pipeline, then back off exponentially to the configured interval
+                timeout = min(
+                    settings.pipeline_poll_interval, 2 ** min(idle_cycles, 16)
+                )
+                self._shutdown_event.wait(timeout=timeout)
         finally:
             self._handle_processed_files()
             logger.info("Shutting down pipeline")
@@ -208,25 +248,40 @@ class Pipeline:
             if self._received_signal is not None:
                 sys.exit(128 + self._received_signal)
 
-    def _run_tracking_cycle(self):
+    def _run_tracking_cycle(self, check_tasks: bool = True) -> bool:
         """Run one iteration of the pipeline tracking loop.
 
+        Returns whether any file was staged, processed, or failed. With
+        `check_tasks` false, only files are tracked and task status is left as is.
+
         `_handle_task_timeout` reads the task status that `_check_task_status`
         refreshes, so it must not run before it; a stale status resubmits a
         Slurm job that has already been replaced.
         """
-        self._check_task_status()
-        self._handle_task_timeout()
+        n_seen = self._count_seen_files()
+        if check_tasks:
+            self._check_task_status()
+            self._handle_task_timeout()
         self._stage_new_files()
         self._report_failed_files()
         self._handle_processed_files()
         self._check_inactivity()
+        return self._count_seen_files() != n_seen
+
+    def _count_seen_files(self) -> int:
+        """Count the staged files and task outputs seen so far, which only grows."""
+        return (
+            len(self._filenames)
+            + sum(len(names) for names in self._task_processed_filenames.values())
+            + sum(len(names) for names in self._task_error_filenames.values())
+        )
 
     def _start_tasks(self):
         tasks_meta = [
             {"name": t.name, "depends_on": t.depends_on} for t in self._config.tasks
         ]
         logger.log("INIT", json.dumps({"tasks": tasks_meta}))
+        slurm_scripts: dict[str, str] = {}
         for task in self._config.tasks:
             logger.info("[{}] Starting as a {} task", task.name, task.kind.upper())
             task.runner_pid = os.getpid()
@@ -237,26 +292,39 @@ class Pipeline:
                 self._subprocesses[task.name] = process
                 logger.info("[{}] Started with PID {}", task.name, process.pid)
             elif isinstance(task, SlurmTaskConfig):
-                job_id = submit_to_slurm(script)
-                self._slurm_task_ids[task.name] = job_id
-                logger.info("[{}] Submitted with Slurm job ID {}", task.name, job_id)
+                slurm_scripts[task.name] = script
             else:
                 raise ValueError(f"Unsupported task kind: {type(task)}")
 
-    def _build_staging_context(self) -> StagingContext:
-        """Build the current context for staging middleware."""
-        n_finished = sum(1 for f in self._finished_dir.iterdir() if f.is_file())
+        # Each sbatch call waits on a round trip to the Slurm controller,
+        # so submit all Slurm tasks at once rather than one after another
+        if slurm_scripts:
+            with ThreadPoolExecutor(max_workers=len(slurm_scripts)) as executor:
+                job_ids = executor.map(submit_to_slurm, slurm_scripts.values())
+                for name, job_id in zip(slurm_scripts, job_ids):
+                    self._slurm_task_ids[name] = job_id
+                    logger.info("[{}] Submitted with Slurm job ID {}", name, job_id)
+
+    def _build_staging_context(
+        self, candidates: list[Path] | None = None
+    ) -> StagingContext:
+        """Build the current context for staging middleware.
+
+        Pass the files from `_list_staging_candidates` if they are already
+        at hand, to spare another listing of the input directory.
+        """
+        if candidates is None:
+            candidates = self._list_staging_candidates()
+        # Only the pipeline writes to .finished (empty marker files), so its
+        # entries need no checks
+        n_finished = len(os.listdir(self._finished_dir))
         n_failed = sum(len(e) for e in self._task_error_filenames.values())
-        n_staged = sum(1 for f in self._symlinks_dir.iterdir() if f.is_file())
-        n_waiting = sum(
-            1
-            for f in self._input_dir.iterdir()
-            if f.is_file()
-            and f.name.endswith(self._config.root_input_ext)
-            and f.name not in self._filenames
-        )
+        # A staged input deleted before cleanup leaves a broken link, which
+        # must not hold staging capacity
+        with os.scandir(self._symlinks_dir) as entries:
+            n_staged = sum(1 for entry in entries if entry.is_file())
         return StagingContext(
-            waiting=n_waiting,
+            waiting=len(candidates),
             staged=n_staged - n_failed,
             completed=n_finished,
             failed=n_failed,
@@ -264,28 +332,77 @@ class Pipeline:
             output_dir=self._output_dir,
         )
 
+    def _record_scan(self, purpose: str, directory: Path, mtime: int):
+        """Record that a directory was fully scanned for a purpose at an mtime.
+
+        Adding, removing, or renaming an entry updates the directory's mtime,
+        so while it stays at the recorded value a rescan would find nothing
+        new. However, an entry added in the same timestamp tick as a scan may
+        leave the mtime unchanged, and the filesystem server (e.g., NFS) may
+        stamp it by a clock other than ours. So an mtime is only trusted once
+        a later scan, at least `DIR_MTIME_SETTLE_NS` apart, sees it again.
+        """
+        key = (purpose, directory)
+        now = time.monotonic_ns()
+        seen = self._scanned_mtimes.get(key)
+        first_seen = seen[1] if seen is not None and seen[0] == mtime else now
+        stable = now - first_seen >= DIR_MTIME_SETTLE_NS
+        self._scanned_mtimes[key] = (mtime, first_seen, stable)
+
+    def _is_scanned(self, purpose: str, directory: Path, mtime: int) -> bool:
+        """Check whether a directory was fully scanned for a purpose at an mtime."""
+        seen = self._scanned_mtimes.get((purpose, directory))
+        return seen is not None and seen[0] == mtime and seen[2]
+
+    def _list_staging_candidates(self) -> list[Path]:
+        """List input files that have not been staged yet."""
+        ext, filenames = self._config.root_input_ext, self._filenames
+        # DirEntry.is_file() uses the file type from the directory listing,
+        # so a stat is only paid by staging middleware that needs one
+        with os.scandir(self._input_dir) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(ext)
+                and entry.name not in filenames
+                and entry.is_file()
+            ]
+
     def _stage_new_files(self):
-        context = self._build_staging_context()
-        candidates = [
-            f
-            for f in self._input_dir.iterdir()
-            if f.is_file()
-            and f.name.endswith(self._config.root_input_ext)
-            and f.name not in self._filenames
-        ]
+        # Candidates held back by some middleware may pass later (e.g., by age
+        # or capacity) without the input directory changing, so only skip the
+        # scan when the previous pass staged everything it found or every
+        # rejection was permanent (e.g., a filename mismatch)
+        mtime = os.stat(self._input_dir).st_mtime_ns
+        if self._is_scanned("stage", self._input_dir, mtime):
+            return
+        candidates = self._list_staging_candidates()
+        context = self._build_staging_context(candidates)
         to_stage = self._config.staging.process(candidates, context)
+        # Link with plain string paths to skip building a Path per link
+        symlinks_dir = str(self._symlinks_dir)
+        add_filename = self._filenames.add
         for file in to_stage:
-            self._symlinks_dir.joinpath(file.name).symlink_to(file)
-            self._filenames.add(file.name)
+            os.symlink(file, os.path.join(symlinks_dir, file.name))
+            add_filename(file.name)
+        if len(to_stage) == len(candidates) or not self._config.staging.may_defer:
+            self._record_scan("stage", self._input_dir, mtime)
 
     def _check_task_status(self):
+        # Poll all Slurm tasks together rather than one squeue call per task
+        slurm_jobs = {
+            self._slurm_task_ids[task.name]: task.worker_job_name
+            for task in self._config.tasks
+            if isinstance(task, SlurmTaskConfig)
+        }
+        slurm_statuses = get_slurm_task_statuses(slurm_jobs) if slurm_jobs else {}
+
         for task in self._config.tasks:
             if isinstance(task, (LocalTaskConfig, LocalAsyncTaskConfig)):
                 process = self._subprocesses[task.name]
                 status = self._get_subprocess_status(process)
             elif isinstance(task, SlurmTaskConfig):
-                job_id = self._slurm_task_ids[task.name]
-                status = get_slurm_task_status(job_id, task.worker_job_name)
+                status = slurm_statuses[self._slurm_task_ids[task.name]]
             else:
                 raise ValueError(f"Unsupported task kind: {type(task)}")
 
@@ -320,18 +437,25 @@ class Pipeline:
 
     def _report_failed_files(self):
         for task in self._config.tasks:
+            mtime = os.stat(task.output_dir).st_mtime_ns
+            if self._is_scanned("failed", task.output_dir, mtime):
+                continue
             n_files = 0
-            for file in task.output_dir.iterdir():
-                if (
-                    file.is_file()
-                    and file.name.endswith(".err")
-                    and not file.name.startswith(TEMP_FILE_PREFIX)
-                    and file.name not in self._task_error_filenames[task.name]
-                ):
-                    self._task_error_filenames[task.name].add(file.name)
-                    n_files += 1
+            error_filenames = self._task_error_filenames[task.name]
+            with os.scandir(task.output_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (
+                        name.endswith(".err")
+                        and name not in error_filenames
+                        and not name.startswith(TEMP_FILE_PREFIX)
+                        and entry.is_file()
+                    ):
+                        error_filenames.add(name)
+                        n_files += 1
             if n_files > 0:
                 logger.error("[{}] {} failed files", task.name, n_files)
+            self._record_scan("failed", task.output_dir, mtime)
 
     def _handle_processed_files(self):
         # Identify *newly* processed files for each task
@@ -339,54 +463,102 @@ class Pipeline:
             task.name: set() for task in self._config.tasks
         }
         for task in self._config.tasks:
-            for file in task.output_dir.iterdir():
-                if (
-                    file.is_file()
-                    and file.name.endswith(task.output_ext)
-                    and not file.name.startswith(TEMP_FILE_PREFIX)
-                    and file.name not in self._task_processed_filenames[task.name]
-                ):
-                    self._task_processed_filenames[task.name].add(file.name)
-                    processed_filenames_by_task[task.name].add(file.name)
-                    if task.keep_output:
-                        new_file = self._output_dir / task.name / file.name
-                        shutil.copy(file, new_file)
-
-        # Identify files that have completed all pipeline tasks
-        completed_file_ids: set[str] = set.intersection(
-            *(
-                {
-                    filename.removesuffix(task.output_ext)
-                    for filename in processed_filenames_by_task[task.name]
-                }
-                for task in self._config.terminal_tasks
-            )
-        )
-
-        # Record completion and clean up staged/input files
-        for file_id in completed_file_ids:
-            filename = f"{file_id}{self._config.root_input_ext}"
-            self._finished_dir.joinpath(filename).touch()
-            self._symlinks_dir.joinpath(filename).unlink(missing_ok=True)
-            if self._delete_input:
-                self._input_dir.joinpath(filename).unlink(missing_ok=True)
-
-        # Clean up intermediate data for completed files
-        for task in self._config.tasks:
+            mtime = os.stat(task.output_dir).st_mtime_ns
+            if self._is_scanned("processed", task.output_dir, mtime):
+                continue
+            ext = task.output_ext
+            keep_dir = os.path.join(self._output_dir, task.name)
+            seen_filenames = self._task_processed_filenames[task.name]
+            new_filenames = processed_filenames_by_task[task.name]
+            with os.scandir(task.output_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    # Outputs stay here until their file completes, so most
+                    # were seen on an earlier scan; rule them out by name
+                    # before is_file(), which stats on some filesystems
+                    if (
+                        name.endswith(ext)
+                        and name not in seen_filenames
+                        and not name.startswith(TEMP_FILE_PREFIX)
+                        and entry.is_file()
+                    ):
+                        seen_filenames.add(name)
+                        new_filenames.add(name)
+                        if task.keep_output:
+                            new_file = os.path.join(keep_dir, name)
+                            self._keep_output_file(entry.path, new_file)
+            self._record_scan("processed", task.output_dir, mtime)
+
+        # Identify files that have completed all pipeline tasks. Terminal
+        # tasks may finish a file in different cycles, so their IDs are kept
+        # until all agree; only IDs new in this cycle can newly complete.
+        new_terminal_ids: set[str] = set()
+        for task in self._config.terminal_tasks:
+            file_ids = {
+                filename.removesuffix(task.output_ext)
+                for filename in processed_filenames_by_task[task.name]
+            }
+            self._terminal_pending_ids[task.name] |= file_ids
+            new_terminal_ids |= file_ids
+        completed_file_ids = {
+            file_id
+            for file_id in new_terminal_ids
+            if all(file_id in ids for ids in self._terminal_pending_ids.values())
+        }
+        for ids in self._terminal_pending_ids.values():
+            ids -= completed_file_ids
+
+        # Files are independent of each other, so overlap their cleanup,
+        # which helps most on network filesystems with high per-call latency
+        if len(completed_file_ids) > 2:
+            n_workers = min(32, len(completed_file_ids))
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                list(executor.map(self._clean_up_completed_file, completed_file_ids))
+        else:
             for file_id in completed_file_ids:
-                file = task.output_dir / f"{file_id}{task.output_ext}"
-                file.unlink(missing_ok=True)
+                self._clean_up_completed_file(file_id)
 
         # Log progress
         if completed_file_ids:
             logger.info("Completed processing {} files", len(completed_file_ids))
-            n_finished = sum(1 for f in self._finished_dir.iterdir() if f.is_file())
+            n_finished = len(os.listdir(self._finished_dir))
             n_failed = sum(len(errs) for errs in self._task_error_filenames.values())
             if (n_finished + n_failed) >= len(self._filenames):
                 logger.info("No more files to process, starting idle time count")
 
+    @staticmethod
+    def _keep_output_file(src: str, dst: str):
+        """Keep a copy of a task output that survives its cleanup.
+
+        Outputs are never modified once written, so a hard link can stand in
+        for a copy without duplicating the data. Falls back to copying when
+        linking fails, e.g., across filesystems or over an existing file.
+        """
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy(src, dst)
+
+    def _clean_up_completed_file(self, file_id: str):
+        """Record a file's completion and remove its staged and intermediate data.
+
+        The steps are ordered so that a worker never sees a staged file
+        without its task output, which it would treat as unprocessed.
+        """
+        # Record completion and clean up staged/input files
+        filename = f"{file_id}{self._config.root_input_ext}"
+        self._finished_dir.joinpath(filename).touch()
+        self._symlinks_dir.joinpath(filename).unlink(missing_ok=True)
+        if self._delete_input:
+            self._input_dir.joinpath(filename).unlink(missing_ok=True)
+
+        # Clean up intermediate data
+        for task in self._config.tasks:
+            file = task.output_dir / f"{file_id}{task.output_ext}"
+            file.unlink(missing_ok=True)
+
     def _check_inactivity(self):
-        n_finished = sum(1 for file in self._finished_dir.iterdir() if file.is_file())
+        n_finished = len(os.listdir(self._finished_dir))
         n_failed = sum(len(errs) for errs in self._task_error_filenames.values())
         if (n_finished + n_failed) < len(self._filenames):  # Still in progress
             self._last_active = datetime.now()
@@ -1,11 +1,13 @@
+import os
 import re
 import time
 from abc import abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import Annotated, ClassVar, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from tigerflow.logconfig import logger
 from tigerflow.utils import (
@@ -25,11 +27,42 @@ class StagingContext:
     failed: int  # Total error files across tasks
     input_dir: Path  # Reference for companion lookups
     output_dir: Path  # Reference for capacity checks
+    _stats: dict[Path, os.stat_result] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _filenames: dict[Path, frozenset[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def stat(self, file: Path) -> os.stat_result:
+        """Return the file's stat result, cached for the lifetime of the context."""
+        try:
+            return self._stats[file]
+        except KeyError:
+            st = self._stats[file] = file.stat()
+            return st
+
+    def filenames(self, directory: Path) -> frozenset[str]:
+        """Return names of files in a directory, cached for the lifetime of the context."""
+        try:
+            return self._filenames[directory]
+        except KeyError:
+            with os.scandir(directory) as entries:
+                names = frozenset(entry.name for entry in entries if entry.is_file())
+            self._filenames[directory] = names
+            return names
 
 
 class BaseStagingMiddleware(BaseModel):
     """Base class for staging middleware."""
 
+    # Relative cost of a pure filter, whose result does not depend on
+    # candidate order or on the other steps; None for order-sensitive steps
+    _cost: ClassVar[int | None] = None
+    # Whether a candidate held back now may pass later without the input
+    # directory changing (e.g., as it ages or capacity frees up)
+    _may_defer: ClassVar[bool] = True
+
     @abstractmethod
     def __call__(self, candidates: list[Path], context: StagingContext) -> list[Path]:
         pass
@@ -39,39 +72,51 @@ class MinSizeFilter(BaseStagingMiddleware):
     """Filter files by minimum size."""
 
     kind: Literal["min_size"]
+    _cost = 1
     bytes: int = Field(gt=0)
 
     def __call__(self, candidates: list[Path], context: StagingContext) -> list[Path]:
-        return [f for f in candidates if f.stat().st_size >= self.bytes]
+        # Bind lookups to locals ahead of the per-file loop
+        stat, min_bytes = context.stat, self.bytes
+        return [f for f in candidates if stat(f).st_size >= min_bytes]
 
 
 class MaxSizeFilter(BaseStagingMiddleware):
     """Filter files by maximum size."""
 
     kind: Literal["max_size"]
+    _cost = 1
     bytes: int = Field(gt=0)
 
     def __call__(self, candidates: list[Path], context: StagingContext) -> list[Path]:
-        return [f for f in candidates if f.stat().st_size <= self.bytes]
+        stat, max_bytes = context.stat, self.bytes
+        return [f for f in candidates if stat(f).st_size <= max_bytes]
 
 
 class MinAgeFilter(BaseStagingMiddleware):
     """Filter files by minimum age (time since last modification)."""
 
     kind: Literal["min_age"]
+    _cost = 1
     seconds: float = Field(gt=0)
 
     def __call__(self, candidates: list[Path], context: StagingContext) -> list[Path]:
-        now = time.time()
-        return [f for f in candidates if (now - f.stat().st_mtime) >= self.seconds]
+        # One clock reading serves the whole batch
+        cutoff = time.time() - self.seconds
+        stat = context.stat
+        return [f for f in candidates if stat(f).st_mtime <= cutoff]
 
 
 class FilenameMatchFilter(BaseStagingMiddleware):
     """Filter files by regex pattern match on filename."""
 
     kind: Literal["filename_match"]
+    _cost = 0
+    _may_defer = False
     pattern: str
 
+    _regex: re.Pattern[str] = PrivateAttr()
+
     @field_validator("pattern")
     @classmethod
     def validate_pattern(cls, pattern: str) -> str:
@@ -81,15 +126,21 @@ class FilenameMatchFilter(BaseStagingMiddleware):
             raise ValueError(f"Invalid regex pattern: {e}")
         return pattern
 
+    def model_post_init(self, __context) -> None:
+        # Compile once rather than on every polling cycle
+        self._regex = re.compile(self.pattern)
+
     def __call__(self, candidates: list[Path], context: StagingContext) -> list[Path]:
-        regex = re.compile(self.pattern)
-        return [f for f in candidates if regex.search(f.name)]
+        search = self._regex.search
+        return [f for f in candidates if search(f.name)]
 
 
 class CompanionFileFilter(BaseStagingMiddleware):
     """Filter files that have a companion file with a specific extension."""
 
     kind: Literal["companion_file"]
+    _cost = 1
+    _may_defer = False  # A companion arriving changes the directory
     ext: str
 
     @field_validator("ext")
@@ -98,7 +149,13 @@ class CompanionFileFilter(BaseStagingMiddleware):
         return validate_file_ext(ext)
 
     def __call__(self, candidates: list[Path], context: StagingContext) -> list[Path]:
-        return [f for f in candidates if f.with_suffix(self.ext).is_file()]
+        # Look companions up in one listing per directory, not a stat per file
+        ext = self.ext
+        return [
+            f
+            for f in candidates
+            if os.path.splitext(f.name)[0] + ext in context.filenames(f.parent)
+        ]
 
 
 class MaxStagedLimit(BaseStagingMiddleware):
@@ -126,6 +183,7 @@ class SortBy(BaseStagingMiddleware):
     """Sort candidates by attribute for deterministic processing."""
 
     kind: Literal["sort_by"]
+    _may_defer = False
     key: Literal["name", "size", "mtime"] = "name"
     reverse: bool = False
 
@@ -134,11 +192,11 @@ class SortBy(BaseStagingMiddleware):
             return sorted(candidates, key=lambda f: f.name, reverse=self.reverse)
         elif self.key == "size":
             return sorted(
-                candidates, key=lambda f: f.stat().st_size, reverse=self.reverse
+                candidates, key=lambda f: context.stat(f).st_size, reverse=self.reverse
             )
         elif self.key == "mtime":
             return sorted(
-                candidates, key=lambda f: f.stat().st_mtime, reverse=self.reverse
+                candidates, key=lambda f: context.stat(f).st_mtime, reverse=self.reverse
             )
         return candidates
 
@@ -158,15 +216,20 @@ class CallableMiddleware(BaseStagingMiddleware):
     kind: Literal["callable"]
     function: str
 
+    _fn: Callable[[list[Path], StagingContext], list[Path]] = PrivateAttr()
+
     @field_validator("function")
     @classmethod
     def validate_function(cls, function: str) -> str:
         return _validate_callable_function(function)
 
+    def model_post_init(self, __context) -> None:
+        # Resolve once rather than on every polling cycle
+        self._fn = import_callable(self.function)
+
     def __call__(self, candidates: list[Path], context: StagingContext) -> list[Path]:
-        fn = import_callable(self.function)
         try:
-            return fn(candidates, context)
+            return self._fn(candidates, context)
         except Exception as e:
             logger.warning("Callable '{}' raised: {}", self.function, e)
             return []
@@ -191,10 +254,37 @@ class StagingPipeline(BaseModel):
 
     steps: list[StagingMiddlewareConfig] = []
 
+    _ordered_steps: list[BaseStagingMiddleware] = PrivateAttr()
+
+    def model_post_init(self, __context) -> None:
+        # Within each run of consecutive pure filters, run the cheapest first
+        # so that costlier checks (e.g., stat calls) see fewer candidates.
+        # The outcome is unchanged since such filters commute.
+        ordered: list[BaseStagingMiddleware] = []
+        run: list[BaseStagingMiddleware] = []
+        for step in self.steps:
+            if step._cost is None:
+                ordered.extend(sorted(run, key=lambda s: s._cost))
+                ordered.append(step)
+                run = []
+            else:
+                run.append(step)
+        ordered.extend(sorted(run, key=lambda s: s._cost))
+        self._ordered_steps = ordered
+
+    @property
+    def may_defer(self) -> bool:
+        """Whether a candidate held back may pass later in an unchanged directory."""
+        return any(step._may_defer for step in self._ordered_steps)
+
     def process(self, candidates: list[Path], context: StagingContext) -> list[Path]:
-        """Run candidates through all middleware steps in order."""
+        """Run candidates through all middleware steps in order.
+
+        Consecutive pure filters may run in a different order than declared,
+        which does not change the result.
+        """
         result = candidates
-        for step in self.steps:
+        for step in self._ordered_steps:
             result = step(result, context)
             if not result:
                 break
@@ -1,4 +1,5 @@
 import inspect
+import os
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -98,9 +99,10 @@ class Task(ABC):
 
     @staticmethod
     def _remove_temporary_files(dirpath: Path):
-        for file in dirpath.iterdir():
-            if file.is_file() and file.name.startswith(TEMP_FILE_PREFIX):
-                file.unlink()
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.name.startswith(TEMP_FILE_PREFIX) and entry.is_file():
+                    os.unlink(entry.path)
 
     @staticmethod
     def _get_unprocessed_files(
@@ -119,23 +121,26 @@ class Task(ABC):
         processing. Additional tracking is required to
         exclude such in-progress files.
         """
-        processed_ids = {
-            file.name.removesuffix(ext)
-            for file in output_dir.iterdir()
-            for ext in (output_ext, ".err")
-            if file.is_file()
-            and file.name.endswith(ext)
-            and not file.name.startswith(TEMP_FILE_PREFIX)
-        }
-
-        unprocessed_files = [
-            file
-            for file in input_dir.iterdir()
-            if file.is_file()
-            and file.name.endswith(input_ext)
-            and not file.name.startswith(TEMP_FILE_PREFIX)
-            and file.name.removesuffix(input_ext) not in processed_ids
-        ]
+        # Names are checked first so that the file type, which may cost a
+        # stat, is only looked up for entries that could match
+        with os.scandir(output_dir) as entries:
+            processed_ids = {
+                entry.name.removesuffix(ext)
+                for entry in entries
+                if not entry.name.startswith(TEMP_FILE_PREFIX)
+                for ext in (output_ext, ".err")
+                if entry.name.endswith(ext) and entry.is_file()
+            }
+
+        with os.scandir(input_dir) as entries:
+            unprocessed_files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(input_ext)
+                and not entry.name.startswith(TEMP_FILE_PREFIX)
+                and entry.name.removesuffix(input_ext) not in processed_ids
+                and entry.is_file()
+            ]
 
         return unprocessed_files
 
@@ -471,28 +471,35 @@ class SlurmTaskRunner:
 
     def _report_processed_files(self):
         n_files = 0
-        for file in self.config.output_dir.iterdir():
-            if (
-                file.is_file()
-                and file.name.endswith(self.config.output_ext)
-                and not file.name.startswith(TEMP_FILE_PREFIX)
-                and file.name not in self._processed_filenames
-            ):
-                self._processed_filenames.add(file.name)
-                n_files += 1
+        ext, processed_filenames = self.config.output_ext, self._processed_filenames
+        # The worker's outputs pile up until the pipeline collects them, so
+        # skip those already reported before checking the entry type
+        with os.scandir(self.config.output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    name.endswith(ext)
+                    and name not in processed_filenames
+                    and not name.startswith(TEMP_FILE_PREFIX)
+                    and entry.is_file()
+                ):
+                    processed_filenames.add(name)
+                    n_files += 1
         if n_files > 0:
             logger.info("{} processed files", n_files)
 
     def _report_failed_files(self):
         n_files = 0
-        for file in self.config.output_dir.iterdir():
-            if (
-                file.is_file()
-                and file.name.endswith(".err")
-                and not file.name.startswith(TEMP_FILE_PREFIX)
-                and file.name not in self._error_filenames
-            ):
-                self._error_filenames.add(file.name)
-                n_files += 1
+        with os.scandir(self.config.output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    name.endswith(".err")
+                    and name not in self._error_filenames
+                    and not name.startswith(TEMP_FILE_PREFIX)
+                    and entry.is_file()
+                ):
+                    self._error_filenames.add(name)
+                    n_files += 1
         if n_files > 0:
             logger.error("{} failed files", n_files)
@@ -50,57 +50,71 @@ def log_metrics(filename: str):
 
 
 def get_slurm_task_status(client_job_id: int, worker_job_name: str) -> TaskStatus:
+    return get_slurm_task_statuses({client_job_id: worker_job_name})[client_job_id]
+
+
+def get_slurm_task_statuses(jobs: dict[int, str]) -> dict[int, TaskStatus]:
+    """Get the status of several Slurm tasks at once.
+
+    Takes a mapping from client job ID to worker job name. All clients are
+    queried in one `squeue` call and all workers in another, so the cost does
+    not grow with the number of tasks; only clients that have left the queue
+    need a further `sacct` lookup each.
+    """
+    client_states: dict[int, tuple[str, str]] = {}
     client_status = subprocess.run(
-        ["squeue", "-j", str(client_job_id), "-h", "-o", "%.10T"],
+        ["squeue", "-j", ",".join(map(str, jobs)), "-h", "-o", "%i %.10T %.30R"],
         capture_output=True,
         text=True,
     ).stdout
-
-    if "RUNNING" in client_status:
-        worker_status = subprocess.run(
-            ["squeue", "--me", "-n", worker_job_name, "-h", "-o", "%.10T"],
-            capture_output=True,
-            text=True,
-        ).stdout
-
-        return TaskStatus(
-            kind=TaskStatusKind.ACTIVE,
-            detail=f"{worker_status.count('RUNNING')} workers",
-        )
-    elif "PENDING" in client_status:
-        reason = subprocess.run(
-            ["squeue", "-j", str(client_job_id), "-h", "-o", "%.30R"],
-            capture_output=True,
-            text=True,
-        ).stdout
-
-        return TaskStatus(
-            kind=TaskStatusKind.PENDING,
-            detail=f"Reason: {reason.splitlines()[-1].strip()}" if reason else None,
-        )
-    else:  # Client exited — check if workers are still draining
-        worker_status = subprocess.run(
-            ["squeue", "--me", "-n", worker_job_name, "-h", "-o", "%.10T"],
-            capture_output=True,
-            text=True,
-        ).stdout
-
-        if worker_status.strip():
-            return TaskStatus(
+    for line in client_status.splitlines():
+        fields = line.split(None, 2)
+        if len(fields) >= 2 and fields[0].isdigit():
+            reason = fields[2].strip() if len(fields) == 3 else ""
+            client_states[int(fields[0])] = (fields[1], reason)
+
+    worker_states: dict[str, list[str]] = {}
+    worker_names = set(jobs.values())
+    worker_status = subprocess.run(
+        ["squeue", "--me", "-h", "-o", "%.10T %j"],
+        capture_output=True,
+        text=True,
+    ).stdout
+    for line in worker_status.splitlines():
+        fields = line.split(None, 1)
+        if len(fields) == 2 and fields[1] in worker_names:
+            worker_states.setdefault(fields[1], []).append(fields[0])
+
+    statuses: dict[int, TaskStatus] = {}
+    for client_job_id, worker_job_name in jobs.items():
+        state, reason = client_states.get(client_job_id, ("", ""))
+        workers = worker_states.get(worker_job_name, [])
+        if "RUNNING" in state:
+            statuses[client_job_id] = TaskStatus(
                 kind=TaskStatusKind.ACTIVE,
-                detail=f"draining {len(worker_status.strip().splitlines())} workers",
+                detail=f"{workers.count('RUNNING')} workers",
             )
-
-        reason = subprocess.run(
-            ["sacct", "-j", str(client_job_id), "--format=State", "--noheader"],
-            capture_output=True,
-            text=True,
-        ).stdout
-
-        return TaskStatus(
-            kind=TaskStatusKind.INACTIVE,
-            detail=f"Reason: {reason.splitlines()[0].strip()}" if reason else None,
-        )
+        elif "PENDING" in state:
+            statuses[client_job_id] = TaskStatus(
+                kind=TaskStatusKind.PENDING,
+                detail=f"Reason: {reason}" if reason else None,
+            )
+        elif workers:  # Client exited — workers are still draining
+            statuses[client_job_id] = TaskStatus(
+                kind=TaskStatusKind.ACTIVE,
+                detail=f"draining {len(workers)} workers",
+            )
+        else:
+            reason = subprocess.run(
+                ["sacct", "-j", str(client_job_id), "--format=State", "--noheader"],
+                capture_output=True,
+                text=True,
+            ).stdout
+            statuses[client_job_id] = TaskStatus(
+                kind=TaskStatusKind.INACTIVE,
+                detail=f"Reason: {reason.splitlines()[0].strip()}" if reason else None,
+            )
+    return statuses
 
 
 def write_error_file(error_path: Path, input_file: str) -> None:
@@ -1,3 +1,4 @@
+import functools
 import importlib
 import os
 import re
@@ -12,6 +13,9 @@ from types import SimpleNamespace
 
 TEMP_FILE_PREFIX = ".~tf_"
 
+_FILE_EXT_PATTERN = re.compile(r"(\.[a-zA-Z0-9_]+)+")
+_SBATCH_JOB_ID_PATTERN = re.compile(r"Submitted batch job (\d+)")
+
 
 def get_version() -> str:
     from importlib.metadata import PackageNotFoundError, version
@@ -22,11 +26,14 @@ def get_version() -> str:
         return "unknown"
 
 
+@functools.lru_cache(maxsize=256)
 def validate_file_ext(ext: str) -> str:
     """
     Return the string if it is a valid file extension.
+
+    Results are cached since the same few extensions recur across tasks.
     """
-    if not re.fullmatch(r"(\.[a-zA-Z0-9_]+)+", ext):
+    if not _FILE_EXT_PATTERN.fullmatch(ext):
         raise ValueError(f"Invalid file extension: {ext}")
     if ext.lower().endswith(".err"):
         raise ValueError(f"'.err' extension is reserved: {ext}")
@@ -119,7 +126,7 @@ def submit_to_slurm(script: str) -> int:
         detail = (result.stderr or result.stdout).strip()
         raise RuntimeError(f"sbatch failed (exit code {result.returncode}):\n{detail}")
 
-    match = re.search(r"Submitted batch job (\d+)", result.stdout)
+    match = _SBATCH_JOB_ID_PATTERN.search(result.stdout)
     if not match:
         raise ValueError("Failed to extract job ID from sbatch output")
     job_id = int(match.group(1))
@@ -162,8 +169,6 @@ def read_pid_file(pid_file: Path) -> int | None:
 
     Returns None if file doesn't exist or contains invalid content.
     """
-    if not pid_file.exists():
-        return None
     try:
         return int(pid_file.read_text().strip())
     except (ValueError, OSError):
@@ -191,10 +196,21 @@ def has_running_pid(pid_file: Path) -> bool:
 
     Returns True if a process is already running, False otherwise.
     """
+    _, running = read_and_probe_pid(pid_file)
+    return running
+
+
+def read_and_probe_pid(pid_file: Path) -> tuple[int | None, bool]:
+    """
+    Read PID from a file and check if that process is running.
+
+    Returns (pid, is_running), where pid is None if the file doesn't exist
+    or contains invalid content.
+    """
     pid = read_pid_file(pid_file)
     if pid is None:
-        return False
-    return is_process_running(pid)
+        return None, False
+    return pid, is_process_running(pid)
 
 
 @contextmanager
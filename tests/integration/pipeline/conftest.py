@@ -106,11 +106,11 @@ def stop_after_one_cycle(monkeypatch: pytest.MonkeyPatch) -> Callable[[Pipeline]
 
         original_cycle = pipeline._run_tracking_cycle
 
-        def cycle_then_stop():
+        def cycle_then_stop(check_tasks: bool = True):
             # Shutdown must be requested even if the cycle raises, otherwise a
             # failing cycle leaves run() looping until the idle timeout.
             try:
-                original_cycle()
+                original_cycle(check_tasks=check_tasks)
             finally:
                 pipeline._shutdown_event.set()
 
@@ -5,8 +5,10 @@ see. Middleware decides which candidates make the cut, and reads counts from
 a StagingContext the pipeline assembles from the filesystem.
 """
 
+import os
 from collections.abc import Callable
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -82,6 +84,86 @@ class TestStagingSelection:
 
         assert len(list(pipeline._symlinks_dir.iterdir())) == 2
 
+    def test_unchanged_input_dir_is_not_rescanned(
+        self,
+        pipeline_factory: PipelineFactory,
+        input_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """A settled input directory whose mtime has not moved is skipped."""
+        monkeypatch.setattr("tigerflow.pipeline.DIR_MTIME_SETTLE_NS", 0)
+        pipeline = pipeline_factory()
+        (input_dir / "a.txt").write_text("x")
+        os.utime(input_dir, ns=(0, 0))
+
+        pipeline._stage_new_files()
+        pipeline._stage_new_files()  # Confirms the mtime is stable
+        # Sneak a file in without moving the mtime to show the scan is skipped
+        (input_dir / "b.txt").write_text("x")
+        os.utime(input_dir, ns=(0, 0))
+        pipeline._stage_new_files()
+
+        staged = {f.name for f in pipeline._symlinks_dir.iterdir()}
+        assert staged == {"a.txt"}
+
+    def test_single_scan_is_not_trusted(
+        self, pipeline_factory: PipelineFactory, input_dir: Path
+    ):
+        """An mtime seen once is rescanned, however old it looks.
+
+        The mtime comes from the filesystem server's clock, which may lag this
+        node's, and an entry added in the same tick leaves it unchanged.
+        """
+        pipeline = pipeline_factory()
+        (input_dir / "a.txt").write_text("x")
+        os.utime(input_dir, ns=(0, 0))  # Far behind the local clock
+
+        pipeline._stage_new_files()
+        (input_dir / "b.txt").write_text("x")
+        os.utime(input_dir, ns=(0, 0))
+        pipeline._stage_new_files()
+
+        staged = {f.name for f in pipeline._symlinks_dir.iterdir()}
+        assert staged == {"a.txt", "b.txt"}
+
+    def test_held_back_candidates_are_rescanned(
+        self, pipeline_factory: PipelineFactory, input_dir: Path
+    ):
+        """Files held back by middleware are staged later without a new mtime."""
+        pipeline = pipeline_factory(
+            staging={"steps": [{"kind": "max_batch", "count": 2}]}
+        )
+        for i in range(5):
+            (input_dir / f"file{i}.txt").write_text("x")
+        os.utime(input_dir, ns=(0, 0))
+
+        for _ in range(3):
+            pipeline._stage_new_files()
+
+        assert len(list(pipeline._symlinks_dir.iterdir())) == 5
+
+    def test_permanently_rejected_candidates_are_not_rescanned(
+        self,
+        pipeline_factory: PipelineFactory,
+        input_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """A filename mismatch cannot pass later, so the scan is still recorded."""
+        monkeypatch.setattr("tigerflow.pipeline.DIR_MTIME_SETTLE_NS", 0)
+        pipeline = pipeline_factory(
+            staging={"steps": [{"kind": "filename_match", "pattern": "^a"}]}
+        )
+        (input_dir / "a.txt").write_text("x")
+        (input_dir / "skip.txt").write_text("x")
+        os.utime(input_dir, ns=(0, 0))
+
+        pipeline._stage_new_files()
+        pipeline._stage_new_files()
+        with patch.object(pipeline, "_list_staging_candidates") as listing:
+            pipeline._stage_new_files()
+
+        listing.assert_not_called()
+
     def test_duplicate_candidates_propagate_error(
         self, pipeline_factory: PipelineFactory, input_dir: Path
     ):
@@ -216,6 +298,19 @@ class TestStagingContext:
             "Capacity is already full, so no further file should be staged"
         )
 
+    def test_deleted_staged_input_frees_capacity(
+        self, pipeline_factory: PipelineFactory, input_dir: Path
+    ):
+        """A broken link left by a deleted input does not count as staged."""
+        pipeline = pipeline_factory()
+        (input_dir / "a.txt").write_text("x")
+        (input_dir / "b.txt").write_text("x")
+        pipeline._stage_new_files()
+
+        (input_dir / "a.txt").unlink()
+
+        assert pipeline._build_staging_context().staged == 1
+
     def test_counts_stay_consistent_in_mixed_state(
         self, pipeline_factory: PipelineFactory, input_dir: Path
     ):
@@ -9,10 +9,12 @@ more in its `finally` block, so final state after `run()` is one completion
 pass ahead of the same number of bare cycle calls.
 """
 
+import errno
 import signal
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -49,6 +51,20 @@ class TestTrackingCycle:
         assert (pipeline._finished_dir / "a.txt").exists()
         assert not (pipeline._symlinks_dir / "a.txt").exists()
 
+    def test_reports_progress_for_adaptive_polling(
+        self, pipeline_factory: PipelineFactory, input_dir: Path
+    ):
+        """A cycle reports progress while files move, so the next poll comes sooner."""
+        pipeline = pipeline_factory()
+        start_fake_tasks(pipeline)
+
+        (input_dir / "a.txt").write_text("payload")
+        assert pipeline._run_tracking_cycle(), "Staging counts as progress"
+        assert not pipeline._run_tracking_cycle(), "Nothing changed"
+
+        write_output(pipeline, "a")
+        assert pipeline._run_tracking_cycle(), "Processing counts as progress"
+
     def test_file_staged_only_once(
         self, pipeline_factory: PipelineFactory, input_dir: Path
     ):
@@ -110,6 +126,50 @@ class TestKeepOutput:
             "Intermediate output should still be cleaned up"
         )
 
+    def test_kept_output_replaces_stale_file(
+        self, pipeline_factory: PipelineFactory, input_dir: Path
+    ):
+        """A kept file left by an earlier run is overwritten, not preserved."""
+        pipeline = pipeline_factory([task_spec(keep_output=True)])
+        start_fake_tasks(pipeline)
+
+        task = pipeline._config.tasks[0]
+        kept = pipeline._output_dir / task.name / "a.txt"
+        kept.write_text("stale")
+
+        (input_dir / "a.txt").write_text("payload")
+        pipeline._run_tracking_cycle()
+        write_output(pipeline, "a")
+        pipeline._run_tracking_cycle()
+
+        assert kept.read_text() == "done", "The task's output should be kept"
+
+    def test_kept_output_is_hard_linked(self, tmp_path: Path):
+        """Keeping an output links it rather than copying its data."""
+        src, dst = tmp_path / "src.txt", tmp_path / "dst.txt"
+        src.write_text("done")
+
+        Pipeline._keep_output_file(str(src), str(dst))
+
+        assert dst.samefile(src)
+
+    def test_kept_output_falls_back_to_copy(
+        self, pipeline_factory: PipelineFactory, input_dir: Path
+    ):
+        """Outputs are copied when they cannot be linked, e.g., across filesystems."""
+        pipeline = pipeline_factory([task_spec(keep_output=True)])
+        start_fake_tasks(pipeline)
+
+        (input_dir / "a.txt").write_text("payload")
+        pipeline._run_tracking_cycle()
+        write_output(pipeline, "a")
+        cross_device = OSError(errno.EXDEV, "Invalid cross-device link")
+        with patch("tigerflow.pipeline.os.link", side_effect=cross_device):
+            pipeline._run_tracking_cycle()
+
+        task = pipeline._config.tasks[0]
+        assert (pipeline._output_dir / task.name / "a.txt").read_text() == "done"
+
 
 class TestInactivity:
     """Idle timeout drives shutdown once nothing is left to process."""
@@ -6,8 +6,6 @@ only once every terminal task has finished with it.
 
 from pathlib import Path
 
-import pytest
-
 from .helpers import PipelineFactory, stage_file, task_spec, write_output
 
 CHAIN = [
@@ -185,12 +183,6 @@ class TestFanOutCompletion:
         assert (pipeline._finished_dir / "a.txt").exists()
         assert not (pipeline._symlinks_dir / "a.txt").exists()
 
-    @pytest.mark.xfail(
-        reason="Completion intersects only files seen in the current cycle, so a "
-        "terminal task recorded in an earlier cycle drops out and the file is "
-        "never completed",
-        strict=True,
-    )
     def test_finishes_when_terminal_tasks_finish_on_different_cycles(
         self, pipeline_factory: PipelineFactory, input_dir: Path
     ):
@@ -213,11 +205,6 @@ class TestFanOutCompletion:
             "File should be completed once every terminal task has finished"
         )
 
-    @pytest.mark.xfail(
-        reason="Same root cause as staggered completion: the file is never "
-        "completed, so its staged symlink and task outputs are never cleaned up",
-        strict=True,
-    )
     def test_staggered_completion_does_not_leak(
         self, pipeline_factory: PipelineFactory, input_dir: Path
     ):
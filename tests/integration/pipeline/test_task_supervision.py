@@ -121,10 +121,10 @@ class TestSlurmTimeout:
         with (
             patch("tigerflow.pipeline.submit_to_slurm", return_value=222) as resubmit,
             patch(
-                "tigerflow.pipeline.get_slurm_task_status",
+                "tigerflow.pipeline.get_slurm_task_statuses",
                 side_effect=[
-                    slurm_status(TaskStatusKind.INACTIVE, "Reason: TIMEOUT"),
-                    slurm_status(TaskStatusKind.PENDING, "Reason: Priority"),
+                    {111: slurm_status(TaskStatusKind.INACTIVE, "Reason: TIMEOUT")},
+                    {222: slurm_status(TaskStatusKind.PENDING, "Reason: Priority")},
                 ],
             ) as poll,
         ):
@@ -132,7 +132,19 @@ class TestSlurmTimeout:
             pipeline._run_tracking_cycle()
 
         assert resubmit.call_count == 1, "Only the timed-out job should be resubmitted"
-        assert poll.call_args_list[1].args[0] == 222, "Second poll must use the new ID"
+        assert list(poll.call_args_list[1].args[0]) == [222], (
+            "Second poll must use the new ID"
+        )
+
+    def test_file_only_cycle_skips_slurm_polls(self, pipeline_factory: PipelineFactory):
+        """Cycles that only track files leave Slurm to the configured interval."""
+        pipeline = pipeline_factory([SLURM_TASK])
+        pipeline._slurm_task_ids["gpu"] = 111
+
+        with patch("tigerflow.pipeline.get_slurm_task_statuses") as poll:
+            pipeline._run_tracking_cycle(check_tasks=False)
+
+        poll.assert_not_called()
 
 
 class TestSlurmShutdown:
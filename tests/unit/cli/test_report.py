@@ -116,6 +116,31 @@ class TestPipelineOutputReport:
         assert report.failed == 3
         assert len(report.errors.get("task1", [])) == 3
 
+    def test_report_follows_symlinks(self, tmp_path: Path):
+        """Symlinked task directories, task files, and .finished markers count."""
+        internal = tmp_path / ".tigerflow"
+        internal.mkdir()
+        (internal / ".symlinks").mkdir()
+        finished = internal / ".finished"
+        finished.mkdir()
+
+        marker = tmp_path / "marker"
+        marker.touch()
+        (finished / "file0.txt").symlink_to(marker)
+
+        task_dir = tmp_path / "elsewhere"
+        task_dir.mkdir()
+        (task_dir / "file1.err").write_text("Error message")
+        (internal / "task1").symlink_to(task_dir)
+        error = tmp_path / "error"
+        error.write_text("Error message")
+        (task_dir / "file2.err").symlink_to(error)
+
+        report = PipelineOutput(tmp_path).report()
+
+        assert report.processed == 1
+        assert report.failed == 2
+
     def test_report_staged_vs_in_progress(self, tmp_path: Path):
         """Test filesystem-based counts: staged vs in_progress vs processed."""
         internal = tmp_path / ".tigerflow"
@@ -203,6 +228,30 @@ class TestMultiTaskPipeline:
         assert report.failed == 20
         assert report.in_progress == 20
 
+    def test_many_task_pipeline_counts(self, tmp_path: Path):
+        """Test counts when task directories are scanned concurrently."""
+        internal = tmp_path / ".tigerflow"
+        internal.mkdir()
+        symlinks = internal / ".symlinks"
+        symlinks.mkdir()
+        (internal / ".finished").mkdir()
+
+        for i in range(10):
+            (symlinks / f"file{i}.txt").symlink_to(tmp_path / f"file{i}.txt")
+
+        # One failure in each of four task directories
+        for t in range(4):
+            task_dir = internal / f"task{t}"
+            task_dir.mkdir()
+            (task_dir / f"file{t}.err").write_text("Error")
+            (task_dir / "file9.out").touch()
+
+        report = PipelineOutput(tmp_path).report()
+
+        assert report.failed == 4
+        assert report.in_progress == 1
+        assert sorted(report.errors) == ["task0", "task1", "task2", "task3"]
+
 
 class TestTaskMeta:
     """Test task metadata parsing."""
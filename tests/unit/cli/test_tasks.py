@@ -8,6 +8,7 @@ from tigerflow.cli.tasks import (
     _get_installed_tasks,
     _get_package_version,
     _get_task_description,
+    _read_module_docstring,
 )
 
 runner = CliRunner()
@@ -28,6 +29,9 @@ class TestGetBuiltinTasks:
         for name, module_path in tasks:
             assert module_path.startswith("tigerflow.library.")
 
+    def test_result_is_cached(self):
+        assert _get_builtin_tasks() is _get_builtin_tasks()
+
 
 class TestGetInstalledTasks:
     def test_returns_list(self):
@@ -45,6 +49,11 @@ class TestGetTaskDescription:
         desc = _get_task_description("nonexistent.module.that.does.not.exist")
         assert desc is None
 
+    def test_reads_docstring_from_source(self):
+        import tigerflow.library.echo as echo
+
+        assert _read_module_docstring("tigerflow.library.echo") == echo.__doc__.strip()
+
 
 class TestGetPackageVersion:
     def test_returns_version_for_tigerflow(self):
@@ -105,6 +105,12 @@ class TestBaseTaskConfig:
         with pytest.raises(ValidationError, match="Module does not exist"):
             BaseTaskConfig(name="test", module=str(nonexistent), input_ext=".txt")
 
+    def test_module_symlink_loop(self, tmp_path: Path):
+        loop = tmp_path / "loop.py"
+        loop.symlink_to(loop)
+        with pytest.raises(ValidationError, match="Module does not exist"):
+            BaseTaskConfig(name="test", module=str(loop), input_ext=".txt")
+
     def test_module_must_be_file(self, tmp_path: Path):
         directory = tmp_path / "some_dir.py"
         directory.mkdir()
@@ -620,6 +626,13 @@ class TestSlurmTaskConfig:
         assert "#SBATCH --job-name=slurm_task-client" in script
         assert "--runner-pid" not in script
 
+    def test_to_script_omits_unset_flags(self, slurm_config: SlurmTaskConfig):
+        slurm_config.worker_resources.gpus = None
+        script = slurm_config.to_script()
+        command = next(line for line in script.splitlines() if "--task-name" in line)
+        assert "--gpus" not in command
+        assert "  " not in command.strip()
+
 
 class TestPipelineConfig:
     def test_empty_tasks_rejected(self):
@@ -726,6 +739,24 @@ class TestPipelineConfig:
         assert pipeline.tasks[0].name == "task1"
         assert pipeline.tasks[1].name == "task2"
 
+    def test_tasks_sorted_in_tree_order(self, tmp_module: str):
+        # a -> (c, b), b -> d, submitted out of order
+        def task(name: str, depends_on: str | None = None) -> LocalTaskConfig:
+            return LocalTaskConfig(
+                name=name,
+                kind="local",
+                module=tmp_module,
+                input_ext=".txt",
+                output_ext=".txt",
+                depends_on=depends_on,
+            )
+
+        pipeline = PipelineConfig(
+            tasks=[task("c", "a"), task("d", "b"), task("a"), task("b", "a")]
+        )
+        # Depth-first from the root, visiting children in declaration order
+        assert [t.name for t in pipeline.tasks] == ["a", "c", "b", "d"]
+
     def test_root_tasks_must_share_input_ext(self, tmp_module: str):
         with pytest.raises(ValidationError, match="same input extension"):
             PipelineConfig(
@@ -33,6 +33,24 @@ def mock_context(tmp_path: Path) -> StagingContext:
     )
 
 
+class TestStagingContext:
+    def test_stat_is_cached(self, tmp_path: Path, mock_context: StagingContext):
+        file = tmp_path / "a.txt"
+        file.write_bytes(b"x" * 10)
+        first = mock_context.stat(file)
+        file.write_bytes(b"x" * 20)
+        assert mock_context.stat(file) is first
+
+    def test_filenames_lists_files_once(
+        self, tmp_path: Path, mock_context: StagingContext
+    ):
+        (tmp_path / "a.txt").touch()
+        (tmp_path / "subdir").mkdir()
+        assert mock_context.filenames(tmp_path) == {"a.txt"}
+        (tmp_path / "b.txt").touch()
+        assert mock_context.filenames(tmp_path) == {"a.txt"}
+
+
 class TestMinSizeFilter:
     def test_keeps_files_meeting_minimum(
         self, tmp_path: Path, mock_context: StagingContext
@@ -361,6 +379,16 @@ class TestStagingPipeline:
         pipeline = StagingPipeline()
         assert pipeline.steps == []
 
+    def test_may_defer_only_with_temporary_rejections(self):
+        permanent = [
+            {"kind": "filename_match", "pattern": r"\.txt$"},
+            {"kind": "companion_file", "ext": ".json"},
+            {"kind": "sort_by"},
+        ]
+        assert not StagingPipeline(steps=permanent).may_defer
+        deferring = [*permanent, {"kind": "max_batch", "count": 1}]
+        assert StagingPipeline(steps=deferring).may_defer
+
     def test_process_passes_all_with_no_steps(
         self, tmp_path: Path, mock_context: StagingContext
     ):
@@ -411,3 +439,33 @@ class TestStagingPipeline:
         }
         pipeline = StagingPipeline.model_validate(data)
         assert len(pipeline.steps) == 3
+
+    def test_process_runs_cheap_filters_first(
+        self, tmp_path: Path, mock_context: StagingContext
+    ):
+        kept = tmp_path / "keep.txt"
+        kept.write_bytes(b"x" * 100)
+        deleted = tmp_path / "skip.txt"  # Stat would fail if checked
+        pipeline = StagingPipeline(
+            steps=[
+                MinSizeFilter(kind="min_size", bytes=50),
+                FilenameMatchFilter(kind="filename_match", pattern=r"^keep"),
+                MaxBatchLimit(kind="max_batch", count=10),
+            ]
+        )
+        result = pipeline.process([kept, deleted], mock_context)
+        assert result == [kept]
+
+    def test_order_sensitive_steps_keep_position(self):
+        pipeline = StagingPipeline(
+            steps=[
+                MinSizeFilter(kind="min_size", bytes=50),
+                MaxBatchLimit(kind="max_batch", count=10),
+                FilenameMatchFilter(kind="filename_match", pattern=r"^keep"),
+            ]
+        )
+        assert [type(s) for s in pipeline._ordered_steps] == [
+            MinSizeFilter,
+            MaxBatchLimit,
+            FilenameMatchFilter,
+        ]
@@ -1,11 +1,15 @@
 import inspect
+import subprocess
 from pathlib import Path
 from typing import Annotated
+from unittest.mock import patch
 
 import pytest
 import typer
 
+from tigerflow.models import TaskStatus, TaskStatusKind
 from tigerflow.tasks._base import Task
+from tigerflow.tasks.utils import get_slurm_task_statuses
 from tigerflow.utils import TEMP_FILE_PREFIX
 
 
@@ -325,3 +329,47 @@ class TestGetUnprocessedFiles:
             output_ext=".csv",
         )
         assert result == []
+
+
+class TestGetSlurmTaskStatuses:
+    @staticmethod
+    def fake_run(client_out: str, worker_out: str, sacct_out: str = ""):
+        def run(argv, **kwargs):
+            if argv[0] == "sacct":
+                stdout = sacct_out
+            elif "--me" in argv:
+                stdout = worker_out
+            else:
+                stdout = client_out
+            return subprocess.CompletedProcess(argv, 0, stdout=stdout)
+
+        return run
+
+    def test_queries_all_tasks_at_once(self):
+        client_out = "111    RUNNING  node01\n222    PENDING  (Priority)\n"
+        worker_out = "   RUNNING a-worker\n   PENDING a-worker\n   RUNNING other job\n"
+        with patch(
+            "subprocess.run", side_effect=self.fake_run(client_out, worker_out)
+        ) as run:
+            statuses = get_slurm_task_statuses({111: "a-worker", 222: "b-worker"})
+
+        assert run.call_count == 2
+        assert statuses[111] == TaskStatus(
+            kind=TaskStatusKind.ACTIVE, detail="1 workers"
+        )
+        assert statuses[222] == TaskStatus(
+            kind=TaskStatusKind.PENDING, detail="Reason: (Priority)"
+        )
+
+    def test_exited_client(self):
+        worker_out = "   RUNNING a-worker\n"
+        run = self.fake_run("", worker_out, sacct_out="TIMEOUT\n")
+        with patch("subprocess.run", side_effect=run):
+            statuses = get_slurm_task_statuses({111: "a-worker", 222: "b-worker"})
+
+        assert statuses[111] == TaskStatus(
+            kind=TaskStatusKind.ACTIVE, detail="draining 1 workers"
+        )
+        assert statuses[222] == TaskStatus(
+            kind=TaskStatusKind.INACTIVE, detail="Reason: TIMEOUT"
+        )
@@ -10,6 +10,7 @@ from tigerflow.utils import (
     has_running_pid,
     import_callable,
     is_process_running,
+    read_and_probe_pid,
     read_pid_file,
     validate_callable_reference,
     validate_task_cli,
@@ -124,6 +125,20 @@ class TestPidUtilityFunctions:
         pid_file.write_text("999999999")  # Non-existent process
         assert has_running_pid(pid_file) is False
 
+    def test_read_and_probe_pid_no_file(self, tmp_path: Path):
+        pid_file = tmp_path / "run.pid"
+        assert read_and_probe_pid(pid_file) == (None, False)
+
+    def test_read_and_probe_pid_running_process(self, tmp_path: Path):
+        pid_file = tmp_path / "run.pid"
+        pid_file.write_text(str(os.getpid()))
+        assert read_and_probe_pid(pid_file) == (os.getpid(), True)
+
+    def test_read_and_probe_pid_dead_process(self, tmp_path: Path):
+        pid_file = tmp_path / "run.pid"
+        pid_file.write_text("999999999")
+        assert read_and_probe_pid(pid_file) == (999999999, False)
+
 
 class TestValidateCallableReference:
     def test_valid_simple_reference(self):